@@ -1,15 +1,17 @@
 import sys
 import os
 import subprocess
+import multiprocessing
 import pygame
 import chess
 import tkinter as tk
 from tkinter import filedialog
 from src.config import *
-from src.ui import TextInput, LeaderboardView, DisplayBoard, EvaluationBar, Slider
+from src.ui import TextInput, LeaderboardView, DisplayBoard, EvaluationBar, Slider, EngineDebugOverlay
 from src.engine import Engine
 from src.scoring import ScoreManager
-from src.ai import get_best_move, evaluate_board
+from src.ai import get_engine, evaluate_board, set_transposition_table_size, set_book_depth, set_search_workers, set_tablebase_path, set_search_log
+from src.search_service import SearchService
 from src.sound import SoundManager
 from src.pgn_manager import PGNManager
 from src.puzzle_manager import PuzzleManager
@@ -151,6 +153,12 @@ def main():
     pygame.init()
     
     config_manager = ConfigManager()
+    set_transposition_table_size(config_manager.get("tt_size_mb"))
+    set_book_depth(config_manager.get("book_depth"))
+    set_tablebase_path(config_manager.get("syzygy_path"))
+    if config_manager.get("search_log"):
+        set_search_log(os.path.join(get_user_data_dir(), "search_log.jsonl"))
+    set_search_workers(config_manager.get("search_workers"))
     
     # --- INICIALIZAÇÃO SEGURA (Safe Boot) ---
     # 1. Cria a janela em modo "windowed" primeiro com SCALED (garante que a janela exista)
@@ -184,6 +192,7 @@ def main():
     # Inicialização
     engine = Engine()
     engine.start()
+    search_service = SearchService() # Busca da IA fora do loop principal
     score_manager = ScoreManager()
     sound_manager = SoundManager()
 
@@ -201,6 +210,7 @@ def main():
     # Passa os dados da skin salva
     display_board = DisplayBoard(screen, tamanho_quadrado=80, skin_data=skin_manager.get_skin_data(current_skin_id))
     eval_bar = EvaluationBar(pygame.Rect(640, 0, 20, 640))
+    debug_overlay = EngineDebugOverlay(pygame.font.SysFont("arial", 14)) # F3: debug da IA
     input_nome = TextInput(pygame.font.SysFont("consolas", 30), rect=pygame.Rect(170, 300, 300, 50))
     
     # Sliders para Casas Claras (R, G, B) e Escuras (R, G, B)
@@ -245,6 +255,7 @@ def main():
     tempo_escolhido = 600
     ultima_dica_ia = None
     ultima_dica_move = None  # Guarda o movimento sugerido para desenhar seta
+    dica_pendente = False # Dica (H) calculando em segundo plano
     puzzle_difficulty_range = (0, 9999) # Padrão: Tudo
 
     # --- Notificações ---
@@ -353,6 +364,7 @@ def main():
                 if estado_atual == ESTADO_JOGANDO and not engine.is_game_over():
                     score_manager.update_stats('loss')
                     print("Jogo abandonado pelo usuário. Derrota contabilizada.")
+                search_service.cancel() # Não espera a busca da IA terminar
                 pygame.quit()
                 sys.exit()
 
@@ -362,6 +374,10 @@ def main():
                 toggle_fullscreen()
             # -------------------------------
 
+            # --- ATALHO F3 (Debug da IA) ---
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                debug_overlay.toggle()
+
             # Debug: qualquer tecla pressionada
             if event.type == pygame.KEYDOWN:
                 print(f"[DEBUG] Tecla pressionada: {event.key}, estado_atual={estado_atual}")
@@ -374,6 +390,8 @@ def main():
                     score_manager.update_stats('loss')
                     print("Partida abandonada via Menu. Derrota registrada.")
                 # --------------------------------------
+                search_service.cancel()
+                aguardando_ia = False
                 engine.start() # Reseta o tabuleiro
                 estado_atual = ESTADO_MENU
                 sound_manager.play('menu')
@@ -575,9 +593,7 @@ def main():
                         sound_manager.play('menu')
                         estado_atual = ESTADO_JOGANDO
                         if engine.board.turn == chess.WHITE:
-                            move = get_best_move(engine.board, dificuldade)
-                            if move:
-                                realizar_jogada(engine, move, display_board, sound_manager)
+                            aguardando_ia = True # A IA abre o jogo (busca em segundo plano)
 
             elif estado_atual == ESTADO_TUTORIAL:
                 # --- NOVO: Navegação por Teclado ---
@@ -837,21 +853,22 @@ def main():
                     # ESC (Sair)
                     elif event.key == pygame.K_ESCAPE:
                         print("[DEBUG] ESC detectado no puzzle. Voltando ao menu.")
+                        search_service.cancel() # Para o pondering
                         estado_atual = ESTADO_MENU
                         if 'sound_manager' in locals(): sound_manager.play('menu')
                     # Atalhos já existentes
-                    elif event.key == pygame.K_z and (pygame.key.get_mods() & pygame.KMOD_CTRL):
+                    elif event.key == pygame.K_BACKSPACE or (event.key == pygame.K_z and (pygame.key.get_mods() & pygame.KMOD_CTRL)):
                         if len(engine.board.move_stack) >= 2:
                             display_board.active_animation = None
+                            search_service.stop_pondering()
                             engine.board.pop(); engine.board.pop()
                             selecionado = None; sound_manager.play('undo')
                     elif event.key == pygame.K_h:
-                        move = get_best_move(engine.board, dificuldade)
-                        if move:
-                            selecionado = move.from_square
-                            ultima_dica_ia = f"Dica: {chess.square_name(move.from_square)}->{chess.square_name(move.to_square)}"
-                            ultima_dica_move = move
-                            sound_manager.play('hint')
+                        # A dica roda em outra thread (lida a cada frame, abaixo)
+                        if search_service.hint(engine.board, dificuldade):
+                            dica_pendente = True
+                            ultima_dica_ia = "Dica: calculando..."
+                            ultima_dica_move = None
                     elif event.key == pygame.K_s:
                         if (pygame.key.get_mods() & pygame.KMOD_CTRL): # Ctrl+S = Salvar
                             result = engine.board.result()
@@ -963,6 +980,27 @@ def main():
                     dragged_piece = None
                     dragged_from_square = None
 
+            # --- ESTADO: JOGANDO (IA pensando) ---
+            # A busca roda em outra thread e pode ser apressada ou cancelada
+            elif estado_atual == ESTADO_JOGANDO:
+                if event.type == pygame.KEYDOWN:
+                    # Espaço: a IA joga já o melhor lance encontrado até agora
+                    if event.key == pygame.K_SPACE:
+                        search_service.move_now()
+                    # Desfaz o lance do jogador sem esperar a busca
+                    elif event.key == pygame.K_BACKSPACE or (event.key == pygame.K_z and (pygame.key.get_mods() & pygame.KMOD_CTRL)):
+                        if engine.board.move_stack:
+                            display_board.active_animation = None
+                            search_service.cancel()
+                            engine.board.pop()
+                            aguardando_ia = engine.board.turn != (chess.WHITE if jogador_brancas else chess.BLACK)
+                            selecionado = None; sound_manager.play('undo')
+                    elif event.key == pygame.K_ESCAPE:
+                        search_service.cancel()
+                        aguardando_ia = False
+                        estado_atual = ESTADO_MENU
+                        sound_manager.play('menu')
+
             # --- ESTADO: GAME OVER (NOVO) ---
             elif estado_atual == ESTADO_GAME_OVER:
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -1127,18 +1165,43 @@ def main():
                                     selecionado = None
 
         # --- IA ---
+        # A busca roda em outra thread; aqui apenas disparamos e consultamos a cada frame.
+        # Se o tabuleiro mudou sob a busca (undo, puzzle, novo jogo), ela é cancelada na hora
+        search_service.cancel_if_changed(engine.board)
         if estado_atual == ESTADO_JOGANDO and aguardando_ia and not promocao_pendente:
-            if not engine.is_game_over():
-                move = get_best_move(engine.board, dificuldade)
+            if engine.is_game_over():
+                search_service.cancel()
+                aguardando_ia = False
+            elif not search_service.busy:
+                search_service.start(engine.board, dificuldade, engine.get_time_left())
+            elif search_service.done():
+                move = search_service.take_result(engine.board)
                 if move:
                     realizar_jogada(engine, move, display_board, sound_manager)
                     eval_bar.update(evaluate_board(engine.board))
+                    # Pondering: pensa na resposta prevista enquanto o humano joga
+                    if config_manager.get("ponder") and not engine.is_game_over():
+                        search_service.ponder(engine.board, dificuldade)
                 aguardando_ia = False
 
+        # Dica pedida com H: chega quando a busca em segundo plano termina
+        if dica_pendente:
+            move = search_service.take_hint(engine.board)
+            if move:
+                selecionado = move.from_square
+                ultima_dica_ia = f"Dica: {chess.square_name(move.from_square)}->{chess.square_name(move.to_square)}"
+                ultima_dica_move = move
+                sound_manager.play('hint')
+            if not search_service.hinting:
+                dica_pendente = False
+                if not move: # Descartada (lance, desfazer, menu...)
+                    ultima_dica_ia = None
+
         # --- CHECAGEM DE FIM DE JOGO ---
         # --- CHECAGEM DE FIM DE JOGO ---
         if estado_atual == ESTADO_JOGANDO and engine.is_game_over():
             engine.stop()
+            search_service.cancel()
             v = engine.get_winner()
             
             # Lógica para definir resultado
@@ -1818,7 +1881,7 @@ def main():
             screen.blit(fonte_btn.render(fmt(engine.white_time), True, (0,0,0)), (700, 410))
             
             # --- CÓDIGO NOVO: LEGENDA DE ATALHOS ---
-            y_legenda = 500
+            y_legenda = 486
             fonte_legenda = pygame.font.SysFont("arial", 14)
             
             # Verifica cor do som dinamicamente
@@ -1827,10 +1890,12 @@ def main():
 
             atalhos = [
                 ("H - Dica da IA", (180, 180, 180)),
-                ("Ctrl+Z - Desfazer", (180, 180, 180)),
+                ("Ctrl+Z/Bksp - Desfazer", (180, 180, 180)),
+                ("Espaço - IA joga já", (180, 180, 180)),
                 ("Ctrl+S - Salvar PGN", (180, 180, 180)),
                 ("M - Menu Principal", (180, 180, 180)),
                 ("F11 - Tela Cheia", (180, 180, 180)),
+                ("F3 - Debug da IA", (180, 180, 180)),
                 (f"S - Som: {status_som}", cor_som)
             ]
 
@@ -1840,7 +1905,7 @@ def main():
             for texto, cor in atalhos:
                 surf = fonte_legenda.render(texto, True, cor)
                 screen.blit(surf, (670, y_legenda))
-                y_legenda += 22 # Espaçamento entre linhas
+                y_legenda += 18 # Espaçamento entre linhas
             # ---------------------------------------
 
             # Dica e Menu Promoção
@@ -1867,6 +1932,11 @@ def main():
                     img = display_board.images.get((p, cor_promocao_pendente))
                     if img: screen.blit(pygame.transform.scale(img, (60,60)), (mx+10, my + i*50))
 
+            # Overlay de debug da IA: lê as estatísticas ao vivo da busca, sem bloquear
+            if debug_overlay.visible:
+                debug_overlay.draw(screen, display_board, search_service.live_stats(),
+                                   get_engine().table.hashfull(), dt, clock.get_fps(), aguardando_ia)
+
         elif estado_atual == ESTADO_PUZZLE:
             display_board.draw(engine.board)
             
@@ -1980,4 +2050,6 @@ def main():
         pygame.display.flip()
 
 if __name__ == "__main__":
+    # Necessário para a busca paralela (Lazy SMP) no executável do Windows
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -1,375 +1,844 @@
-# --- Transposition Table (Hash de posições) ---
-transpo_table = {}
-import chess
+import json
 import random
+import time
+
+import chess
+
+from src.evaluation import piece_values, IncrementalEvaluator, evaluate_position
+from src.opening_book import OpeningBook
+from src.see import is_losing_capture
+from src.tablebase import EndgameTablebase
+from src.transposition import TranspositionTable, EXACT, LOWER, UPPER
+from src.zobrist import board_key, push_move, push_null
+
+MATE_SCORE = 99999
+# Maior que qualquer pontuação possível (inteiro: cabe na tabela de transposição)
+INFINITY = 1000000
+
+# Quantos lances ainda esperamos jogar com o tempo restante
+MOVES_TO_GO = 30
+# Verifica o relógio a cada N nós (time.perf_counter por nó é desperdício)
+NODES_PER_CLOCK_CHECK = 1024
+
+# --- Ordenação de lances (quanto maior, mais cedo o lance é pesquisado) ---
+ORDER_TT_MOVE = 1000000
+ORDER_CAPTURE = 100000   # + MVV-LVA: vítima valiosa, atacante barato primeiro
+ORDER_PROMOTION = 90000
+ORDER_KILLER = 80000     # Lances quietos que causaram corte na mesma ply
+ORDER_BAD_CAPTURE = -100000  # Capturas com SEE negativa: depois de todos os lances quietos
+# O histórico é reduzido à metade quando passa deste valor (fica abaixo dos killers)
+HISTORY_MAX = 60000
+MAX_PLY = 128
+# Cortes beta contados por índice do lance que cortou (o último balde junta o resto)
+CUTOFF_BUCKETS = 8
+# Gerações que uma partida nova soma à tabela de transposição
+NEW_GAME_AGE = 4
+# Pontuações acima disso são mates (MATE_SCORE - plies até o mate)
+MATE_BOUND = MATE_SCORE - MAX_PLY
+# Vitória comprovada pela tablebase: acima de qualquer avaliação, abaixo dos mates
+TB_WIN_SCORE = MATE_BOUND - MAX_PLY
+
+# --- Podas da busca ---
+# Lance nulo: profundidade mínima e redução (R) aplicada à busca de verificação
+NULL_MOVE_MIN_DEPTH = 3
+NULL_MOVE_REDUCTION = 2
+# Late move reductions: a partir de qual lance/profundidade reduzir lances quietos
+LMR_MIN_INDEX = 3
+LMR_MIN_DEPTH = 3
+LMR_LATE_INDEX = 8  # Daqui em diante a redução é de 2 plies
+# Quiescência: margem da poda delta, maior ganho possível numa captura e
+# profundidade máxima (plies só de capturas) abaixo das folhas
+DELTA_MARGIN = 200
+DELTA_QUEEN = 900
+QUIESCENCE_MAX_DEPTH = 8
+# Janela de aspiração na raiz (centipeões) em torno do valor da iteração anterior;
+# dobra a cada falha e vira janela completa acima do máximo
+ASPIRATION_WINDOW = 50
+ASPIRATION_MAX_WINDOW = 800
+ASPIRATION_MIN_DEPTH = 3
+
+
+class SearchTimeout(Exception):
+    """Levantada dentro da busca quando o orçamento de tempo do lance acaba."""
+
+
+class SearchConfig:
+    """
+    Parâmetros de uma busca (um por dificuldade).
+    max_depth: profundidade máxima do aprofundamento iterativo (o relógio normalmente para antes)
+    max_time: tempo máximo por lance em segundos, mesmo em partidas sem relógio
+    quiescence: estende as folhas com capturas (evita o efeito horizonte)
+    use_book: consulta o livro de aberturas antes de buscar
+    use_tablebase: consulta as tablebases Syzygy (se configuradas) na raiz e na busca
+    """
+
+    def __init__(self, max_depth=3, max_time=1.5, quiescence=True, use_book=True, use_tablebase=True):
+        self.max_depth = max_depth
+        self.max_time = max_time
+        self.quiescence = quiescence
+        self.use_book = use_book
+        self.use_tablebase = use_tablebase
 
-# Valores Materiais
-piece_values = {
-    chess.PAWN: 100,
-    chess.KNIGHT: 320,
-    chess.BISHOP: 330,
-    chess.ROOK: 500,
-    chess.QUEEN: 900,
-    chess.KING: 20000
+    def __repr__(self):
+        return (f"SearchConfig(max_depth={self.max_depth}, max_time={self.max_time}, "
+                f"quiescence={self.quiescence}, use_book={self.use_book}, "
+                f"use_tablebase={self.use_tablebase})")
+
+
+class SearchStats:
+    """
+    Estatísticas de uma chamada de get_best_move (ver get_last_stats).
+    source: de onde veio o lance: "busca", "ponder", "livro" ou "tablebase"
+    nodes/qnodes: nós pesquisados / dos quais na quiescência
+    depth/seldepth: profundidade completa / maior ply alcançada (com quiescência)
+    tt_probes/tt_hits: consultas e acertos na tabela de transposição
+    cutoffs: cortes beta pelo índice do lance que cortou; concentrado no
+             índice 0 = boa ordenação de lances
+    iterations: (profundidade, segundos, nós) de cada iteração completa
+
+    Durante a busca o objeto é atualizado ao vivo (contadores a cada nó;
+    depth, score e pv a cada iteração completa) e pode ser lido de outra thread.
+    """
+
+    def __init__(self, source="busca"):
+        self.source = source
+        self.move = None
+        self.score = 0
+        self.depth = 0
+        self.seldepth = 0
+        self.nodes = 0
+        self.qnodes = 0
+        self.tt_probes = 0
+        self.tt_hits = 0
+        self.cutoffs = [0] * CUTOFF_BUCKETS
+        self.pv = []
+        self.iterations = []
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    @property
+    def nps(self):
+        # Busca ainda em andamento: elapsed só é preenchido no fim
+        elapsed = self.elapsed or (time.perf_counter() - self.started)
+        return int(self.nodes / elapsed) if elapsed > 0 else 0
+
+    @property
+    def tt_hit_rate(self):
+        return self.tt_hits / self.tt_probes if self.tt_probes else 0.0
+
+    def to_dict(self):
+        return {
+            "source": self.source,
+            "move": self.move.uci() if self.move else None,
+            "score": self.score,
+            "depth": self.depth,
+            "seldepth": self.seldepth,
+            "nodes": self.nodes,
+            "qnodes": self.qnodes,
+            "nps": self.nps,
+            "tt_probes": self.tt_probes,
+            "tt_hits": self.tt_hits,
+            "cutoffs": list(self.cutoffs),
+            "pv": [move.uci() for move in self.pv],
+            "elapsed": round(self.elapsed, 4),
+        }
+
+    def __repr__(self):
+        return (f"SearchStats(source={self.source}, depth={self.depth}/{self.seldepth}, "
+                f"nodes={self.nodes}, nps={self.nps}, tt={self.tt_hit_rate:.0%}, "
+                f"pv={' '.join(move.uci() for move in self.pv)})")
+
+
+# Nível 1 joga aleatoriamente e não tem configuração de busca
+DIFFICULTY_CONFIGS = {
+    2: SearchConfig(max_depth=2, max_time=0.5, quiescence=False, use_tablebase=False),
+    3: SearchConfig(max_depth=3, max_time=1.5),
+    4: SearchConfig(max_depth=5, max_time=4.0),
+    5: SearchConfig(max_depth=6, max_time=8.0),
 }
 
-# --- TABELAS POSICIONAIS (PST) ---
-# Valores positivos incentivam a peça a ir para aquela casa.
-# A lógica é espelhada para as pretas automaticamente.
-
-# Peões: Incentiva avançar, mas pune peões centrais muito adiantados sem apoio
-pawns_table = [
-    0,  0,  0,  0,  0,  0,  0,  0,
-    50, 50, 50, 50, 50, 50, 50, 50,
-    10, 10, 20, 30, 30, 20, 10, 10,
-    5,  5, 10, 25, 25, 10,  5,  5,
-    0,  0,  0, 20, 20,  0,  0,  0,
-    5, -5,-10,  0,  0,-10, -5,  5,
-    5, 10, 10,-20,-20, 10, 10,  5,
-    0,  0,  0,  0,  0,  0,  0,  0
-]
-
-# Cavalos: Amam o centro, odeiam as bordas
-knights_table = [
-    -50,-40,-30,-30,-30,-30,-40,-50,
-    -40,-20,  0,  0,  0,  0,-20,-40,
-    -30,  0, 10, 15, 15, 10,  0,-30,
-    -30,  5, 15, 20, 20, 15,  5,-30,
-    -30,  0, 15, 20, 20, 15,  0,-30,
-    -30,  5, 10, 15, 15, 10,  5,-30,
-    -40,-20,  0,  5,  5,  0,-20,-40,
-    -50,-40,-30,-30,-30,-30,-40,-50,
-]
-
-# Bispos: Gostam de diagonais longas e odeiam cantos presos
-bishops_table = [
-    -20,-10,-10,-10,-10,-10,-10,-20,
-    -10,  0,  0,  0,  0,  0,  0,-10,
-    -10,  0,  5, 10, 10,  5,  0,-10,
-    -10,  5,  5, 10, 10,  5,  5,-10,
-    -10,  0, 10, 10, 10, 10,  0,-10,
-    -10, 10, 10, 10, 10, 10, 10,-10,
-    -10,  5,  0,  0,  0,  0,  5,-10,
-    -20,-10,-10,-10,-10,-10,-10,-20,
-]
-
-# Torres: Gostam da 7ª fila e colunas centrais
-rooks_table = [
-    0,  0,  0,  0,  0,  0,  0,  0,
-    5, 10, 10, 10, 10, 10, 10,  5,
-    -5,  0,  0,  0,  0,  0,  0, -5,
-    -5,  0,  0,  0,  0,  0,  0, -5,
-    -5,  0,  0,  0,  0,  0,  0, -5,
-    -5,  0,  0,  0,  0,  0,  0, -5,
-    -5,  0,  0,  0,  0,  0,  0, -5,
-    0,  0,  0,  5,  5,  0,  0,  0
-]
-
-# Rainha: Quase igual ao Bispo, mas com cuidado para não sair cedo demais
-queens_table = [
-    -20,-10,-10, -5, -5,-10,-10,-20,
-    -10,  0,  0,  0,  0,  0,  0,-10,
-    -10,  0,  5,  5,  5,  5,  0,-10,
-     -5,  0,  5,  5,  5,  5,  0, -5,
-      0,  0,  5,  5,  5,  5,  0, -5,
-    -10,  5,  5,  5,  5,  5,  0,-10,
-    -10,  0,  5,  0,  0,  0,  0,-10,
-    -20,-10,-10, -5, -5,-10,-10,-20
-]
-
-# Rei (Meio Jogo): Esconda-se atrás dos peões! (Roque)
-king_mid_table = [
-    -30,-40,-40,-50,-50,-40,-40,-30,
-    -30,-40,-40,-50,-50,-40,-40,-30,
-    -30,-40,-40,-50,-50,-40,-40,-30,
-    -30,-40,-40,-50,-50,-40,-40,-30,
-    -20,-30,-30,-40,-40,-30,-30,-20,
-    -10,-20,-20,-20,-20,-20,-20,-10,
-     20, 20,  0,  0,  0,  0, 20, 20,
-     20, 30, 10,  0,  0, 10, 30, 20
-]
-
-# Rei (Final de Jogo): Centralize o Rei!
-king_end_table = [
-    -50,-40,-30,-20,-20,-30,-40,-50,
-    -30,-20,-10,  0,  0,-10,-20,-30,
-    -30,-10, 20, 30, 30, 20,-10,-30,
-    -30,-10, 30, 40, 40, 30,-10,-30,
-    -30,-10, 30, 40, 40, 30,-10,-30,
-    -30,-10, 20, 30, 30, 20,-10,-30,
-    -30,-30,  0,  0,  0,  0,-30,-30,
-    -50,-30,-30,-30,-30,-30,-30,-50
-]
-
-# --- Função de Ordenação MVV-LVA ---
-def score_move(move, board):
-    if board.is_capture(move):
-        victim = board.piece_at(move.to_square)
-        victim_val = piece_values.get(victim.piece_type, 0) if victim else 0
-        aggressor = board.piece_at(move.from_square)
-        aggressor_val = piece_values.get(aggressor.piece_type, 0) if aggressor else 0
-        return 10000 + victim_val - aggressor_val
-    return 0
-
-# --- Busca de Quiescência ---
-def quiescence(board, alpha, beta):
-    stand_pat = evaluate_board(board)
-    if stand_pat >= beta:
-        return beta
-    if alpha < stand_pat:
-        alpha = stand_pat
-    capturas = [m for m in board.legal_moves if board.is_capture(m)]
-    capturas.sort(key=lambda m: score_move(m, board), reverse=True)
-    for move in capturas:
-        board.push(move)
-        score = -quiescence(board, -beta, -alpha)
-        board.pop()
-        if score >= beta:
-            return beta
-        if score > alpha:
-            alpha = score
-    return alpha
+
+def config_for(difficulty):
+    return DIFFICULTY_CONFIGS.get(difficulty, DIFFICULTY_CONFIGS[5])
+
+
+def compute_time_budget(config, time_left=None):
+    """
+    Orçamento (em segundos) para um lance.
+    time_left: tempo restante do lado que joga (Engine.get_time_left()) ou None.
+    """
+    if time_left is None:
+        return config.max_time
+    # Divide o relógio pelos lances restantes, sem nunca passar do teto da dificuldade
+    return max(0.05, min(config.max_time, time_left / MOVES_TO_GO))
+
+
+def score_to_table(score, ply):
+    """
+    Mates são guardados na tabela como distância a partir da posição (não da
+    raiz), para valerem quando a mesma posição aparece em outra ply.
+    """
+    if score >= MATE_BOUND:
+        return score + ply
+    if score <= -MATE_BOUND:
+        return score - ply
+    return score
+
+
+def score_from_table(score, ply):
+    if score >= MATE_BOUND:
+        return score - ply
+    if score <= -MATE_BOUND:
+        return score + ply
+    return score
+
 
 def evaluate_board(board):
+    """
+    Pontuação do tabuleiro do ponto de vista das BRANCAS, para a barra de
+    avaliação. A busca não usa esta função: ela detecta mate/afogamento pela
+    falta de lances legais e avalia as folhas só com o avaliador incremental.
+    """
     if board.is_checkmate():
-        if board.turn: return -99999
-        else: return 99999
-    
-    if board.is_stalemate() or board.is_insufficient_material():
-        return 0
-
-    score = 0
-    # Detecta final de jogo: sem rainhas ou material muito reduzido
-    num_queens = len(board.pieces(chess.QUEEN, chess.WHITE)) + len(board.pieces(chess.QUEEN, chess.BLACK))
-    num_minors = sum(len(board.pieces(pt, chess.WHITE)) + len(board.pieces(pt, chess.BLACK)) for pt in [chess.BISHOP, chess.KNIGHT])
-    is_endgame = num_queens == 0 or (num_queens == 2 and (len(board.pieces(chess.ROOK, chess.WHITE)) + len(board.pieces(chess.ROOK, chess.BLACK)) + num_minors) <= 1)
-
-    for square in chess.SQUARES:
-        piece = board.piece_at(square)
-        if not piece: continue
-
-        # Valor Material Base
-        value = piece_values.get(piece.piece_type, 0)
-
-        # Valor Posicional (PST)
-        pst_value = 0
-        
-        # Espelha o índice se for peça preta (para usar a mesma tabela)
-        table_idx = square if piece.color == chess.WHITE else chess.square_mirror(square)
-
-        if piece.piece_type == chess.PAWN:
-            pst_value = pawns_table[table_idx]
-        elif piece.piece_type == chess.KNIGHT:
-            pst_value = knights_table[table_idx]
-        elif piece.piece_type == chess.BISHOP:
-            pst_value = bishops_table[table_idx]
-        elif piece.piece_type == chess.ROOK:
-            pst_value = rooks_table[table_idx]
-        elif piece.piece_type == chess.QUEEN:
-            pst_value = queens_table[table_idx]
-        elif piece.piece_type == chess.KING:
-            # Usa tabela de finais para o Rei se for endgame
-            if is_endgame:
-                pst_value = king_end_table[table_idx]
-            else:
-                pst_value = king_mid_table[table_idx]
+        if board.turn: return -MATE_SCORE # Brancas levaram mate (turn=True)
+        else: return MATE_SCORE # Pretas levaram mate
+    # Material + tabelas posicionais de todas as peças
+    return evaluate_position(board)
 
-        if piece.color == chess.WHITE:
-            score += (value + pst_value)
-        else:
-            score -= (value + pst_value)
-            
-    return score
 
-# --- MINIMAX OTIMIZADO ---
-def minimax(board, depth, alpha, beta, maximizing_player):
-    # Transposition Table Lookup
-    key = (board.transposition_key(), depth, maximizing_player)
-    if key in transpo_table:
-        return transpo_table[key]
+def _game_history_keys(board):
+    """Chaves das posições da partida desde o último lance irreversível."""
+    keys = []
+    b = board.copy()
+    for _ in range(min(board.halfmove_clock, len(board.move_stack))):
+        b.pop()
+        keys.append(board_key(b))
+    return keys
 
-    if depth == 0 or board.is_game_over():
-        val = quiescence(board, alpha, beta)
-        transpo_table[key] = val
-        return val
 
-    legal_moves = list(board.legal_moves)
-    # Ordenação MVV-LVA
-    legal_moves.sort(key=lambda m: score_move(m, board), reverse=True)
+class SearchEngine:
+    """
+    Motor de busca da IA: negamax alfa-beta com busca de variante principal
+    (PVS), lance nulo, late move reductions, aprofundamento iterativo,
+    quiescência, tabela de transposição e chave Zobrist incremental.
+
+    evaluator: qualquer objeto com reset(board), push(board, move), pop() e
+    score() (pontuação do ponto de vista das brancas). Padrão: IncrementalEvaluator.
+    tablebase: EndgameTablebase consultada dentro da busca, ou None.
+    """
 
-    if maximizing_player:
-        max_eval = -float('inf')
-        for move in legal_moves:
+    def __init__(self, table=None, evaluator=None, tablebase=None):
+        self.table = table if table is not None else TranspositionTable()
+        self.evaluator = evaluator if evaluator is not None else IncrementalEvaluator()
+        self.tablebase = tablebase
+        self.config = SearchConfig()
+        # Contadores da busca atual (nós, tabela, cortes...); novo a cada iterative_deepening
+        self.stats = SearchStats()
+        self.deadline = None
+        # Evento que pede para a busca parar (cancelamento pela interface, auxiliares do Lazy SMP)
+        self.stop_event = None
+        # Chaves Zobrist das posições anteriores (partida + caminho atual da busca)
+        self.key_history = []
+        self.root_ply = 0
+        # (lance, valor) do melhor lance da raiz já pontuado na busca atual,
+        # mesmo numa iteração interrompida; None até o primeiro lance terminar
+        self.root_best = None
+        # Dois lances "killer" por ply e histórico por [cor][origem][destino]
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        self.history = [0] * (2 * 64 * 64)
+
+    def clear(self):
+        """Esquece tudo que foi aprendido (tabela e histórico): benchmarks reprodutíveis."""
+        self.table.clear()
+        self.history = [0] * (2 * 64 * 64)
+
+    def _check_time(self):
+        stats = self.stats
+        stats.nodes += 1
+        if stats.nodes % NODES_PER_CLOCK_CHECK == 0:
+            if self.deadline is not None and time.perf_counter() >= self.deadline:
+                raise SearchTimeout()
+            # Parada de fora só depois de a raiz ter um lance pontuado: "jogue já"
+            # sempre devolve um lance pesquisado, nunca um sorteado
+            if self.stop_event is not None and self.stop_event.is_set() and self.root_best is not None:
+                raise SearchTimeout()
+
+    def order_moves(self, board, moves, tt_move, ply):
+        """
+        Ordena os lances: lance da tabela, capturas boas (MVV-LVA), promoções,
+        killers desta ply, lances quietos pelo histórico e, por último,
+        capturas que perdem material pela SEE.
+        """
+        killer1, killer2 = self.killers[ply] if ply < MAX_PLY else (None, None)
+        history = self.history
+        color_offset = 4096 if board.turn == chess.WHITE else 0
+        them = board.occupied_co[not board.turn]
+        ep_square = board.ep_square
+        piece_type_at = board.piece_type_at
+        scored = []
+        for i, move in enumerate(moves):
+            to_sq = move.to_square
+            if move == tt_move:
+                score = ORDER_TT_MOVE
+            elif them & chess.BB_SQUARES[to_sq]:
+                score = 10 * piece_type_at(to_sq) - piece_type_at(move.from_square)
+                # Capturas que perdem material (SEE < 0) vão para o fim da lista
+                score += ORDER_BAD_CAPTURE if is_losing_capture(board, move) else ORDER_CAPTURE
+            elif to_sq == ep_square and piece_type_at(move.from_square) == chess.PAWN:
+                score = ORDER_CAPTURE + 10 * chess.PAWN - chess.PAWN
+            elif move.promotion:
+                score = ORDER_PROMOTION + move.promotion
+            elif move == killer1:
+                score = ORDER_KILLER + 1
+            elif move == killer2:
+                score = ORDER_KILLER
+            else:
+                score = history[color_offset + move.from_square * 64 + to_sq]
+            scored.append((score, i, move))
+        # Tuplas (score, índice, lance): sem lambda e sem comparar chess.Move
+        scored.sort(reverse=True)
+        return [move for _, _, move in scored]
+
+    def record_cutoff(self, board, move, depth, ply):
+        """Um lance quieto causou corte beta: vira killer e ganha pontos no histórico."""
+        if board.is_capture(move) or move.promotion:
+            return
+        if ply < MAX_PLY:
+            killers = self.killers[ply]
+            if killers[0] != move:
+                killers[1] = killers[0]
+                killers[0] = move
+        index = (4096 if board.turn == chess.WHITE else 0) + move.from_square * 64 + move.to_square
+        self.history[index] += depth * depth
+        if self.history[index] > HISTORY_MAX:
+            self.history = [h // 2 for h in self.history]
+
+    def quiescence(self, board, alpha, beta, qdepth=0):
+        """
+        Busca só capturas até a posição ficar "quieta".
+        Pontuação do ponto de vista de quem joga (negamax).
+        qdepth: plies de quiescência já percorridos (limitado a QUIESCENCE_MAX_DEPTH).
+        """
+        self._check_time()
+        stats = self.stats
+        stats.qnodes += 1
+        ply = len(board.move_stack) - self.root_ply
+        if ply > stats.seldepth:
+            stats.seldepth = ply
+        stand_pat = self.evaluator.score()
+        if board.turn == chess.BLACK:
+            stand_pat = -stand_pat
+        if stand_pat >= beta:
+            return beta
+        # Nem ganhando uma dama a posição alcança alpha: nenhuma captura adianta
+        if stand_pat + DELTA_QUEEN + DELTA_MARGIN < alpha:
+            return alpha
+        if alpha < stand_pat:
+            alpha = stand_pat
+        if qdepth >= QUIESCENCE_MAX_DEPTH:
+            return alpha
+
+        piece_type_at = board.piece_type_at
+        capturas = []
+        for i, move in enumerate(board.generate_legal_captures()):
+            to_sq = move.to_square
+            # En passant: a casa de destino está vazia, mas a vítima é um peão
+            victim = piece_type_at(to_sq) or chess.PAWN
+            attacker = piece_type_at(move.from_square)
+            if not move.promotion:
+                # Poda delta: a captura não devolve o material que falta para alpha
+                if stand_pat + piece_values[victim] + DELTA_MARGIN <= alpha:
+                    continue
+            # Capturas que perdem material na troca (SEE < 0) não acalmam a posição
+            if is_losing_capture(board, move):
+                continue
+            capturas.append((10 * victim - attacker, i, move))
+        # MVV-LVA: vítima valiosa, atacante barato primeiro
+        capturas.sort(reverse=True)
+
+        for _, _, move in capturas:
+            self.evaluator.push(board, move)
             board.push(move)
-            eval = minimax(board, depth - 1, alpha, beta, False)
+            score = -self.quiescence(board, -beta, -alpha, qdepth + 1)
             board.pop()
-            max_eval = max(max_eval, eval)
-            alpha = max(alpha, eval)
-            if beta <= alpha: break
-        transpo_table[key] = max_eval
-        return max_eval
-    else:
-        min_eval = float('inf')
-        for move in legal_moves:
-            board.push(move)
-            eval = minimax(board, depth - 1, alpha, beta, True)
+            self.evaluator.pop()
+            if score >= beta:
+                return beta
+            if score > alpha:
+                alpha = score
+        return alpha
+
+    def _leaf(self, board, alpha, beta):
+        """Avaliação da folha do ponto de vista de quem joga."""
+        if self.config.quiescence:
+            return self.quiescence(board, alpha, beta)
+        ply = len(board.move_stack) - self.root_ply
+        if ply > self.stats.seldepth:
+            self.stats.seldepth = ply
+        score = self.evaluator.score()
+        return score if board.turn == chess.WHITE else -score
+
+    def negamax(self, board, depth, alpha, beta, key, allow_null=True):
+        """
+        Busca alfa-beta (negamax + PVS). Pontuação do ponto de vista de quem joga.
+        key: chave Zobrist da posição atual, mantida incrementalmente por push_move.
+        allow_null: False logo após um lance nulo (evita dois seguidos).
+        """
+        self._check_time()
+        in_check = board.is_check()
+        if depth <= 0:
+            if not in_check:
+                return self._leaf(board, alpha, beta)
+            # Extensão de xeque: a folha em xeque é expandida para detectar o mate
+            depth = 1
+        # Repetição, regra dos 50 lances e material insuficiente: empate
+        if key in self.key_history or board.halfmove_clock >= 100 or board.is_insufficient_material():
+            return 0
+
+        ply = len(board.move_stack) - self.root_ply
+        # Poda pela distância do mate: nem o mate mais rápido daqui melhora a janela
+        alpha = max(alpha, -MATE_SCORE + ply)
+        beta = min(beta, MATE_SCORE - ply - 1)
+        if alpha >= beta:
+            return alpha
+
+        # Tablebase: resultado exato ao entrar num final de poucas peças (após captura
+        # ou lance de peão; as posições seguintes nem chegam a ser pesquisadas)
+        if self.tablebase is not None and self.config.use_tablebase and board.halfmove_clock == 0:
+            wdl = self.tablebase.probe_wdl(board, key)
+            if wdl is not None:
+                if wdl > 1:
+                    return TB_WIN_SCORE - ply
+                if wdl < -1:
+                    return -TB_WIN_SCORE + ply
+                return 0
+
+        # Consulta a tabela: só vale se a entrada foi calculada com profundidade suficiente
+        entry = self.table.probe(key)
+        self.stats.tt_probes += 1
+        tt_move = None
+        if entry is not None:
+            self.stats.tt_hits += 1
+            tt_depth, tt_score, tt_flag, tt_move = entry
+            tt_score = score_from_table(tt_score, ply)
+            if tt_depth >= depth:
+                if tt_flag == EXACT:
+                    return tt_score
+                if tt_flag == LOWER:
+                    alpha = max(alpha, tt_score)
+                else:
+                    beta = min(beta, tt_score)
+                if beta <= alpha:
+                    return tt_score
+        alpha_orig = alpha
+
+        # Lance nulo: se mesmo passando a vez a posição continua >= beta, corta.
+        # Não vale em xeque nem sem peças além de peões (zugzwang é comum nesses finais).
+        if (allow_null and depth >= NULL_MOVE_MIN_DEPTH and not in_check
+                and abs(beta) < MATE_BOUND
+                and board.occupied_co[board.turn] & ~(board.pawns | board.kings)):
+            reduction = NULL_MOVE_REDUCTION + (1 if depth > 6 else 0)
+            null_key = push_null(board, key)
+            score = -self.negamax(board, depth - 1 - reduction, -beta, -beta + 1, null_key, False)
             board.pop()
-            min_eval = min(min_eval, eval)
-            beta = min(beta, eval)
-            if beta <= alpha: break
-        transpo_table[key] = min_eval
-        return min_eval
-
-def get_best_move(board, difficulty):
-    legal_moves = list(board.legal_moves)
-    if not legal_moves: return None
-
-    # Nível 1: Fácil (Aleatório)
-    if difficulty == 1:
-        return random.choice(legal_moves)
-
-    # Profundidade adaptativa por dificuldade
-    # 2 = fácil, 3 = médio, 4 = difícil, 5+ = profissional
-    if difficulty == 2:
-        depth = 2
-    elif difficulty == 3:
-        depth = 3
-    elif difficulty == 4:
-        depth = 5
-    else:
-        depth = 6
-    
-    maximizing = (board.turn == chess.WHITE)
-    best_value = -float('inf') if maximizing else float('inf')
-    best_move = None
-    
-    # Embaralha para variar jogos iguais, mas ordena capturas primeiro
-    random.shuffle(legal_moves)
-    legal_moves.sort(key=lambda move: 1 if board.is_capture(move) else 0, reverse=True)
-
-    for move in legal_moves:
-        board.push(move)
-        board_value = minimax(board, depth - 1, -float('inf'), float('inf'), not maximizing)
-        board.pop()
-        
-        if maximizing:
-            if board_value > best_value:
-                best_value = board_value
+            if score >= beta:
+                return beta
+
+        moves = list(board.legal_moves)
+        if not moves:
+            # Fim de jogo detectado aqui, sem avaliar: mate (mais rápido = melhor) ou afogamento
+            return -MATE_SCORE + ply if in_check else 0
+        moves = self.order_moves(board, moves, tt_move, ply)
+        killers = self.killers[ply] if ply < MAX_PLY else ()
+
+        evaluator = self.evaluator
+        best_score = -INFINITY
+        best_move = None
+        self.key_history.append(key)
+        for index, move in enumerate(moves):
+            # Lances tardios quietos ou capturas perdedoras (SEE < 0) podem ser reduzidos
+            reducible = (index >= LMR_MIN_INDEX and depth >= LMR_MIN_DEPTH and not in_check
+                         and not move.promotion and move not in killers
+                         and (not board.is_capture(move) or is_losing_capture(board, move)))
+            evaluator.push(board, move)
+            child_key = push_move(board, key, move)
+            if index == 0:
+                # Primeiro lance (provável variante principal): janela completa
+                score = -self.negamax(board, depth - 1, -beta, -alpha, child_key)
+            else:
+                reduction = 0
+                if reducible and not board.is_check():
+                    reduction = 1 if index < LMR_LATE_INDEX else 2
+                # Janela nula: só prova que o lance não é melhor que alpha
+                score = -self.negamax(board, depth - 1 - reduction, -alpha - 1, -alpha, child_key)
+                if score > alpha and reduction:
+                    score = -self.negamax(board, depth - 1, -alpha - 1, -alpha, child_key)
+                if alpha < score < beta:
+                    score = -self.negamax(board, depth - 1, -beta, -alpha, child_key)
+            board.pop()
+            evaluator.pop()
+            if score > best_score:
+                best_score = score
                 best_move = move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta: # Poda
+                self.record_cutoff(board, move, depth, ply)
+                self.stats.cutoffs[min(index, CUTOFF_BUCKETS - 1)] += 1
+                break
+        self.key_history.pop()
+
+        # Valores fora da janela original são apenas limites, não valores exatos
+        if best_score <= alpha_orig:
+            flag = UPPER
+        elif best_score >= beta:
+            flag = LOWER
         else:
-            if board_value < best_value:
+            flag = EXACT
+        self.table.store(key, depth, score_to_table(best_score, ply), flag, best_move)
+        return best_score
+
+    def search_root(self, board, legal_moves, depth, alpha=-INFINITY, beta=INFINITY):
+        """
+        Uma iteração completa na raiz com janela (alpha, beta). Retorna
+        (melhor_lance, valor), com o valor do ponto de vista de quem joga.
+        Valor <= alpha ou >= beta é apenas um limite (a janela falhou).
+        """
+        best_value = -INFINITY
+        best_move = None
+        key = board_key(board)
+        self.key_history.append(key)
+        for index, move in enumerate(legal_moves):
+            self.evaluator.push(board, move)
+            child_key = push_move(board, key, move)
+            if index == 0:
+                board_value = -self.negamax(board, depth - 1, -beta, -alpha, child_key)
+            else:
+                # Os demais lances só precisam provar que não superam o melhor até agora
+                board_value = -self.negamax(board, depth - 1, -alpha - 1, -alpha, child_key)
+                if alpha < board_value < beta:
+                    board_value = -self.negamax(board, depth - 1, -beta, -alpha, child_key)
+            board.pop()
+            self.evaluator.pop()
+            if board_value > best_value:
                 best_value = board_value
                 best_move = move
-                
-    return best_move if best_move else random.choice(legal_moves)
-import chess
-import random
+                self.root_best = (move, board_value)
+            if board_value > alpha:
+                alpha = board_value
+            if alpha >= beta:
+                break
+        self.key_history.pop()
+        return best_move, best_value
+
+    def search_aspiration(self, board, legal_moves, depth, previous):
+        """
+        Busca a raiz numa janela estreita em torno do valor da iteração
+        anterior, alargando-a do lado que falhou até o valor ficar dentro.
+        previous: valor da iteração anterior ou None (janela completa).
+        """
+        if previous is None or depth < ASPIRATION_MIN_DEPTH or abs(previous) >= MATE_BOUND:
+            return self.search_root(board, legal_moves, depth)
+        delta = ASPIRATION_WINDOW
+        alpha, beta = previous - delta, previous + delta
+        while True:
+            move, value = self.search_root(board, legal_moves, depth, alpha, beta)
+            if value <= alpha:
+                alpha = max(value - delta, -INFINITY)
+            elif value >= beta:
+                beta = min(value + delta, INFINITY)
+                # O lance que falhou alto é o melhor candidato para a nova busca
+                legal_moves.remove(move)
+                legal_moves.insert(0, move)
+            else:
+                return move, value
+            delta *= 2
+            if delta > ASPIRATION_MAX_WINDOW:
+                alpha, beta = -INFINITY, INFINITY
+
+    def principal_variation(self, board, max_length=16):
+        """Variante principal a partir de `board`, seguindo os lances da tabela de transposição."""
+        pv = []
+        b = board.copy(stack=False)
+        key = board_key(b)
+        seen = set()
+        while len(pv) < max_length and key not in seen:
+            seen.add(key)
+            entry = self.table.probe(key)
+            if entry is None or entry[3] is None or not b.is_legal(entry[3]):
+                break
+            pv.append(entry[3])
+            key = push_move(b, key, entry[3])
+        return pv
+
+    def iterative_deepening(self, board, config, budget, start_depth=1, stop_event=None, rng=random,
+                            on_iteration=None, until_stopped=False):
+        """
+        Busca profundidade start_depth, start_depth+1... até config.max_depth ou até
+        o orçamento (segundos) acabar. stop_event (opcional) interrompe a busca de fora
+        (checado a cada NODES_PER_CLOCK_CHECK nós, inclusive na primeira iteração).
+        rng: embaralha os lances da raiz (processos do Lazy SMP usam sementes diferentes).
+        until_stopped: não para sozinha na metade do orçamento; só o relógio ou
+        stop_event terminam a busca (processos auxiliares do Lazy SMP).
+        on_iteration: chamada com self.stats ao fim de cada iteração completa (ex.: linhas info do UCI).
+        Retorna (melhor_lance, profundidade_completa, valor) da última iteração COMPLETA;
+        parada (stop_event) antes de completar a primeira, o melhor lance já
+        pontuado nela, com profundidade 0.
+        """
+        legal_moves = list(board.legal_moves)
+        start = time.perf_counter()
+        root_ply = len(board.move_stack)
+        # Embaralha movimentos para não ser previsível em posições iguais
+        rng.shuffle(legal_moves)
+
+        best_move, best_depth, best_value = None, 0, 0
+        self.config = config
+        stats = self.stats = SearchStats()
+        self.root_ply = root_ply
+        # Killers valem só para esta busca; o histórico é envelhecido
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        self.history = [h // 2 for h in self.history]
+        self.stop_event = stop_event
+        game_keys = _game_history_keys(board)
+        root_key = board_key(board)
+        self.root_best = None
+        try:
+            for depth in range(start_depth, config.max_depth + 1):
+                # A primeira iteração sempre termina: garante um lance válido
+                self.deadline = start + budget if depth > start_depth else None
+                self.key_history = list(game_keys)
+                self.evaluator.reset(board)
+                try:
+                    previous = best_value if best_move is not None else None
+                    move, value = self.search_aspiration(board, legal_moves, depth, previous)
+                except SearchTimeout:
+                    # Desfaz os lances deixados no tabuleiro pela iteração abortada
+                    while len(board.move_stack) > root_ply:
+                        board.pop()
+                    if best_move is None:
+                        # Iteração parcial: todos os lances da raiz pesquisados têm valor exato
+                        best_move, best_value = self.root_best
+                        stats.move, stats.score, stats.pv = best_move, best_value, [best_move]
+                    break
+                best_move, best_depth, best_value = move, depth, value
+                # search_root não grava a raiz: guarda o lance e o valor exato da
+                # iteração completa (lance de emergência de get_best_move e PV)
+                self.table.store(root_key, depth, score_to_table(value, 0), EXACT, move)
+                stats.iterations.append((depth, time.perf_counter() - start, stats.nodes))
+                # Resultado parcial visível para quem acompanha a busca (overlay de debug)
+                board.push(move)
+                stats.pv = [move] + self.principal_variation(board)
+                board.pop()
+                stats.move, stats.depth, stats.score = move, depth, value
+                if on_iteration is not None:
+                    on_iteration(stats)
+                # O melhor lance da iteração anterior é pesquisado primeiro na próxima
+                legal_moves.remove(move)
+                legal_moves.insert(0, move)
+                if abs(value) >= MATE_BOUND: # Mate encontrado, aprofundar não muda nada
+                    break
+                # A próxima iteração custa mais que todas as anteriores somadas
+                if not until_stopped and time.perf_counter() - start > budget / 2:
+                    break
+        finally:
+            self.deadline = None
+            self.stop_event = None
+            self.key_history = []
+            stats.elapsed = time.perf_counter() - start
+        return best_move, best_depth, best_value
+
+
+# --- Estado do módulo: um motor, o livro, as tablebases e (opcional) a busca paralela ---
+opening_book = OpeningBook()
+tablebase = EndgameTablebase()
+_engine = SearchEngine(tablebase=tablebase)
+# Busca paralela (Lazy SMP); None = um único núcleo
+_parallel = None
+# Estatísticas do último lance e arquivo JSONL onde registrá-las (None = não registra)
+_last_stats = None
+_search_log_path = None
+
+
+def get_engine():
+    """O SearchEngine usado por get_best_move (tabela de transposição, avaliador...)."""
+    return _engine
+
+
+def set_transposition_table_size(size_mb):
+    """Realoca a tabela de transposição com o orçamento de memória em MB."""
+    if _parallel is not None:
+        # A tabela compartilhada tem tamanho fixo: recria os processos auxiliares
+        workers = _parallel.workers
+        set_search_workers(1)
+        _engine.table.resize(size_mb)
+        set_search_workers(workers)
+    else:
+        _engine.table.resize(size_mb)
 
-# Valores das peças para a IA calcular trocas
-piece_values = {
-    chess.PAWN: 100,
-    chess.KNIGHT: 320,
-    chess.BISHOP: 330,
-    chess.ROOK: 500,
-    chess.QUEEN: 900,
-    chess.KING: 20000
-}
 
-# Tabela de Posição (Simplificada): Incentiva controle do centro
-# Peças ganham bônus se estiverem nas casas centrais (valores maiores no meio da matriz)
-pawn_table = [
-    0,  0,  0,  0,  0,  0,  0,  0,
-    50, 50, 50, 50, 50, 50, 50, 50,
-    10, 10, 20, 30, 30, 20, 10, 10,
-    5,  5, 10, 25, 25, 10,  5,  5,
-    0,  0,  0, 20, 20,  0,  0,  0,
-    5, -5,-10,  0,  0,-10, -5,  5,
-    5, 10, 10,-20,-20, 10, 10,  5,
-    0,  0,  0,  0,  0,  0,  0,  0
-]
+def set_book_depth(max_ply):
+    """Até quantos meios-lances da partida o livro de aberturas é consultado (0 desliga)."""
+    opening_book.max_ply = max_ply
 
-def evaluate_board(board):
-    """Calcula a pontuação estática do tabuleiro do ponto de vista das BRANCAS."""
-    if board.is_checkmate():
-        if board.turn: return -99999 # Brancas levaram mate (turn=True)
-        else: return 99999 # Pretas levaram mate
-    score = 0
-    # Material
-    for square in chess.SQUARES:
-        piece = board.piece_at(square)
-        if not piece: continue
-        value = piece_values.get(piece.piece_type, 0)
-        # Adiciona bônus posicional simples para peões (incentiva avançar)
-        if piece.piece_type == chess.PAWN:
-            # Espelha a tabela para as pretas
-            idx = square if piece.color == chess.WHITE else chess.square_mirror(square)
-            value += pawn_table[idx]
-        if piece.color == chess.WHITE:
-            score += value
-        else:
-            score -= value
-    return score
 
-def minimax(board, depth, alpha, beta, maximizing_player):
-    """Algoritmo recursivo para prever jogadas."""
-    if depth == 0 or board.is_game_over():
-        return evaluate_board(board)
-    if maximizing_player: # Vez das Brancas (querem pontuação positiva)
-        max_eval = -float('inf')
-        for move in board.legal_moves:
-            board.push(move)
-            eval = minimax(board, depth - 1, alpha, beta, False)
-            board.pop()
-            max_eval = max(max_eval, eval)
-            alpha = max(alpha, eval)
-            if beta <= alpha: break # Poda
-        return max_eval
-    else: # Vez das Pretas (querem pontuação negativa)
-        min_eval = float('inf')
-        for move in board.legal_moves:
-            board.push(move)
-            eval = minimax(board, depth - 1, alpha, beta, True)
-            board.pop()
-            min_eval = min(min_eval, eval)
-            beta = min(beta, eval)
-            if beta <= alpha: break # Poda
-        return min_eval
+def get_last_stats():
+    """SearchStats do último lance devolvido por get_best_move (ou None)."""
+    return _last_stats
+
+
+def set_search_log(path):
+    """Registra as estatísticas de cada lance da IA em `path` (JSONL). None desliga."""
+    global _search_log_path
+    _search_log_path = path or None
+
+
+def record_stats(board, difficulty, stats):
+    """Guarda as estatísticas do lance escolhido em `board` e grava no log, se ligado."""
+    global _last_stats
+    _last_stats = stats
+    if _search_log_path is None:
+        return
+    entry = {"time": round(time.time(), 3), "fen": board.fen(), "difficulty": difficulty}
+    entry.update(stats.to_dict())
+    try:
+        with open(_search_log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+    except OSError as e:
+        print(f"Aviso: não foi possível gravar o log da busca ({_search_log_path}): {e}")
 
-def get_best_move(board, difficulty):
+
+def _instant_stats(source, move):
+    """Estatísticas de um lance que não precisou de busca (livro, tablebase, aleatório)."""
+    stats = SearchStats(source)
+    stats.move = move
+    stats.pv = [move]
+    return stats
+
+
+def set_tablebase_path(path):
+    """Pasta com as tablebases Syzygy (None ou "" desliga)."""
+    tablebase.set_path(path)
+    if _parallel is not None:
+        # Os processos auxiliares abrem as tablebases na criação
+        workers = _parallel.workers
+        set_search_workers(1)
+        set_search_workers(workers)
+
+
+def set_search_workers(workers):
+    """
+    Nº de processos que buscam a mesma posição (Lazy SMP) compartilhando a
+    tabela de transposição. 1 = busca em um único núcleo.
+    """
+    global _parallel
+    if _parallel is not None:
+        _parallel.close()
+        _parallel = None
+        _engine.table = TranspositionTable(_engine.table.size_mb)
+    if workers and workers > 1:
+        from src.smp import LazySMP
+        _parallel = LazySMP(workers, _engine.table.size_mb, tablebase.path)
+        _engine.table = _parallel.table
+
+
+def get_best_move(board, difficulty, time_left=None, stop_event=None):
     """
     difficulty 1: Aleatório (Fácil)
-    difficulty 2: Profundidade 2 (Médio)
-    difficulty 3: Profundidade 3 (Difícil)
+    difficulty 2+: Aprofundamento iterativo (1, 2, 3...) até a profundidade máxima
+    da dificuldade ou até o orçamento de tempo acabar.
+    Nas primeiras jogadas, consulta antes o livro de aberturas; nos finais com
+    poucas peças, as tablebases Syzygy (se houver uma pasta configurada).
+    time_left: segundos restantes no relógio de quem joga (None = sem relógio).
+    stop_event: threading.Event que encerra a busca antes do tempo ("jogue já"
+    ou cancelamento pela interface).
+    Retorna o melhor lance da última iteração COMPLETA (ou, se parada antes
+    de completar a primeira, o melhor lance já pesquisado nela).
+    As estatísticas da busca ficam em get_last_stats().
+    """
+    move, stats = search_best_move(board, difficulty, time_left, stop_event)
+    if stats is not None:
+        record_stats(board, difficulty, stats)
+    return move
+
+
+def search_best_move(board, difficulty, time_left=None, stop_event=None):
+    """
+    Mesma busca de get_best_move, sem registrar nada: retorna (lance,
+    SearchStats do lance). Quem joga o lance decide se registra as estatísticas
+    (record_stats) — buscas descartadas e dicas não vão para o log.
     """
     legal_moves = list(board.legal_moves)
-    if not legal_moves: return None
+    if not legal_moves: return None, None
     # Nível Fácil: Joga qualquer coisa
     if difficulty == 1:
-        return random.choice(legal_moves)
-    # Níveis Médio/Difícil: Usa Minimax
-    best_move = None
-    depth = 2 if difficulty == 2 else 3
-    # Se for vez das Brancas, queremos maximizar. Se Pretas, minimizar.
-    maximizing = (board.turn == chess.WHITE)
-    best_value = -float('inf') if maximizing else float('inf')
-    # Embaralha movimentos para não ser previsível em posições iguais
-    random.shuffle(legal_moves)
-    for move in legal_moves:
-        board.push(move)
-        # Chama o minimax recursivo
-        board_value = minimax(board, depth - 1, -float('inf'), float('inf'), not maximizing)
-        board.pop()
-        if maximizing:
-            if board_value > best_value:
-                best_value = board_value
-                best_move = move
-        else:
-            if board_value < best_value:
-                best_value = board_value
-                best_move = move
-    return best_move if best_move else random.choice(legal_moves)
+        move = random.choice(legal_moves)
+        return move, _instant_stats("aleatorio", move)
+
+    config = config_for(difficulty)
+    # Abertura: lance do livro é instantâneo
+    if config.use_book:
+        book_move = opening_book.choose_move(board, difficulty)
+        if book_move:
+            return book_move, _instant_stats("livro", book_move)
+    # Final coberto pelas tablebases: lance perfeito sem buscar
+    if config.use_tablebase:
+        tablebase_move = tablebase.best_move(board)
+        if tablebase_move:
+            return tablebase_move, _instant_stats("tablebase", tablebase_move)
+
+    budget = compute_time_budget(config, time_left)
+    _engine.table.new_search()
+    if _parallel is not None:
+        # Estatísticas só do processo principal; o lance pode vir de um auxiliar
+        best_move = _parallel.search(_engine, board, config, budget, stop_event)
+    else:
+        best_move, _, _ = _engine.iterative_deepening(board, config, budget, stop_event=stop_event)
+    _engine.stats.move = best_move
+    return best_move, _engine.stats
 
-import random
+
+def new_game():
+    """
+    Partida nova: envelhece a tabela de transposição e o histórico em vez de
+    apagá-los (aberturas se repetem entre partidas).
+    """
+    _engine.table.new_search(NEW_GAME_AGE)
+    _engine.history = [h // 4 for h in _engine.history]
+
+
+def predict_reply(board):
+    """
+    Lance esperado do adversário em `board` (logo depois do lance da IA): o
+    segundo lance da variante principal da última busca, lido da tabela.
+    """
+    pv = _engine.principal_variation(board, 1)
+    return pv[0] if pv else None
+
+
+def ponder_best_move(board, difficulty, stop_event):
+    """
+    Pondering: busca `board` (a posição depois do lance previsto do humano)
+    no tempo do adversário, até a profundidade máxima da dificuldade ou até
+    stop_event. Usa só o motor principal, mesmo com a busca paralela ligada.
+    Retorna (lance, SearchStats do lance); parada antes de completar a primeira
+    iteração, o melhor lance já pesquisado nela.
+    """
+    if board.is_game_over() or difficulty == 1:
+        return None, None
+    config = config_for(difficulty)
+    if config.use_book:
+        book_move = opening_book.choose_move(board, difficulty)
+        if book_move:
+            return book_move, _instant_stats("livro", book_move)
+    if config.use_tablebase:
+        tablebase_move = tablebase.best_move(board)
+        if tablebase_move:
+            return tablebase_move, _instant_stats("tablebase", tablebase_move)
+    _engine.table.new_search()
+    best_move, _, _ = _engine.iterative_deepening(board, config, float('inf'), stop_event=stop_event)
+    _engine.stats.source = "ponder"
+    _engine.stats.move = best_move
+    return best_move, _engine.stats
 
 
 def movimento_aleatorio(board):
@@ -0,0 +1,179 @@
+"""
+Benchmark do motor de busca: roda get_best_move em cada dificuldade sobre um
+conjunto fixo de ~50 posições (aberturas, meio-jogos, finais e os puzzles de
+data/puzzles.json) e mostra nós, nós/s, tempo até cada profundidade, taxa de
+acerto da tabela de transposição e uma assinatura (total de nós).
+
+A busca roda sem limite de tempo, só até a profundidade de cada dificuldade,
+com tabela limpa, sem livro nem tablebases e com sementes fixas: a assinatura só muda quando
+muda a busca. Compare-a entre duas versões de src/ai.py.
+
+Uso: python -m src.bench [--difficulties 2 3 4 5] [--limit N] [--verbose]
+"""
+import argparse
+import inspect
+import json
+import os
+import random
+import time
+
+import chess
+
+import src.ai as ai
+
+PUZZLES_PATH = os.path.join("data", "puzzles.json")
+# Quantos puzzles entram no conjunto de posições
+PUZZLE_POSITIONS = 12
+
+# Posições fixas: (grupo, FEN)
+POSITIONS = [
+    ("abertura", chess.STARTING_FEN),
+    ("abertura", "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2"),
+    ("abertura", "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3"),
+    ("abertura", "rnbqkb1r/pp2pppp/3p1n2/8/3NP3/8/PPP2PPP/RNBQKB1R w KQkq - 1 5"),
+    ("abertura", "rnbqkb1r/ppp2ppp/4pn2/3p4/2PP4/2N5/PP2PPPP/R1BQKBNR w KQkq - 2 4"),
+    ("abertura", "rnbqk1nr/ppp2ppp/4p3/3p4/1b1PP3/2N5/PPP2PPP/R1BQKBNR w KQkq - 2 4"),
+    ("abertura", "rn1qkbnr/pp2pppp/2p5/3pPb2/3P4/8/PPP2PPP/RNBQKBNR w KQkq - 1 4"),
+    ("abertura", "rnbqk2r/ppp1ppbp/3p1np1/8/2PPP3/2N5/PP3PPP/R1BQKBNR w KQkq - 0 5"),
+    ("abertura", "r1bqk1nr/pppp1ppp/2n5/2b1p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4"),
+    ("abertura", "rnbqkb1r/pppp1ppp/5n2/4p3/2P5/2N3P1/PP1PPP1P/R1BQKBNR b KQkq - 0 3"),
+    ("meio-jogo", "r2q1rk1/pp2bppp/2n1pn2/3p4/3P4/2NBPN2/PP3PPP/R2Q1RK1 w - - 0 10"),
+    ("meio-jogo", "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"),
+    ("meio-jogo", "r3k2r/2pb1ppp/2pp1q2/p7/1nP1B3/1P2P3/P2N1PPP/R2QK2R w KQkq a6 0 14"),
+    ("meio-jogo", "4rrk1/2p1b1p1/p1p3q1/4p3/2P2n1p/1P1NR2P/PB3PP1/3R1QK1 b - - 2 24"),
+    ("meio-jogo", "r3qbrk/6p1/2b2pPp/p3pP1Q/PpPpP2P/3P1B2/2PB3K/R5R1 w - - 16 42"),
+    ("meio-jogo", "6k1/1R3p2/6p1/2Bp3p/3P2q1/P7/1P2rQ1K/5R2 b - - 4 44"),
+    ("meio-jogo", "7r/2p3k1/1p1p1qp1/1P1Bp3/p1P2r1P/P7/4R3/Q4RK1 w - - 0 36"),
+    ("meio-jogo", "r1bq1rk1/pp2b1pp/n1pp1n2/3P1p2/2P1p3/2N1P2N/PP2BPPP/R1BQ1RK1 b - - 2 10"),
+    ("meio-jogo", "3r3k/2r4p/1p1b3q/p4P2/P2Pp3/1B2P3/3BQ1RP/6K1 w - - 3 87"),
+    ("meio-jogo", "2r4r/1p4k1/1Pnp4/3Qb1pq/8/4BpPp/5P2/2RR1BK1 w - - 0 42"),
+    ("meio-jogo", "4q1bk/6b1/7p/p1p4p/PNPpP2P/KN4P1/3Q4/4R3 b - - 0 37"),
+    ("meio-jogo", "2q3r1/1r2pk2/pp3pp1/2pP3p/P1Pb1BbP/1P4Q1/R3NPP1/4R1K1 w - - 2 34"),
+    ("meio-jogo", "1r2r2k/1b4q1/pp5p/2pPp1p1/P3Pn2/1P1B1Q1P/2R3P1/4BR1K b - - 1 37"),
+    ("meio-jogo", "r3kbbr/pp1n1p1P/3ppnp1/q5N1/1P1pP3/P1N1B3/2P1QP2/R3KB1R b KQkq b3 0 17"),
+    ("meio-jogo", "1r4k1/4ppb1/2n1b1qp/pB4p1/1n1BP1P1/7P/2PNQPK1/3RN3 w - - 8 29"),
+    ("meio-jogo", "1r6/1P4bk/3qr1p1/N6p/3pp2P/6R1/3Q1PP1/1R4K1 w - - 1 42"),
+    ("meio-jogo", "r1bqkb1r/pppp1ppp/2n2n2/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 4 4"),
+    ("final", "8/8/4k3/8/2K5/3P4/8/8 w - - 0 1"),
+    ("final", "8/8/1P6/5pr1/8/4R3/7k/2K5 w - - 0 1"),
+    ("final", "8/8/2k5/5q2/5n2/8/5K2/8 b - - 0 1"),
+    ("final", "8/8/8/8/5kp1/P7/8/1K1N4 w - - 0 1"),
+    ("final", "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1"),
+    ("final", "8/8/3P3k/8/1p6/8/1P6/1K3n2 b - - 0 1"),
+    ("final", "6k1/4pp1p/3p2p1/P1pPb3/R7/1r2P1PP/3B1P2/6K1 w - - 0 1"),
+    ("final", "8/3p4/p1bk3p/Pp6/1Kp1PpPp/2P2P1P/2P5/5B2 b - - 0 1"),
+    ("final", "5k2/7R/4P2p/5K2/p1r2P1p/8/8/8 b - - 0 1"),
+    ("final", "8/6pk/2b1Rp2/3r4/1R1B2PP/P5K1/8/2r5 b - - 16 42"),
+    ("final", "2r3k1/pp3ppp/2n1b3/3p4/3P4/2PB1N2/P4PPP/4R1K1 w - - 0 20"),
+]
+
+
+def load_positions(puzzles_path=PUZZLES_PATH, puzzle_count=PUZZLE_POSITIONS):
+    """Posições fixas + os primeiros puzzles (em andamento) de data/puzzles.json."""
+    positions = list(POSITIONS)
+    try:
+        with open(puzzles_path, encoding="utf-8") as f:
+            puzzles = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Aviso: puzzles indisponíveis ({puzzles_path}): {e}")
+        puzzles = []
+    for puzzle in puzzles:
+        if len(positions) >= len(POSITIONS) + puzzle_count:
+            break
+        board = chess.Board(puzzle["fen"])
+        if not board.is_game_over():
+            positions.append(("puzzle", puzzle["fen"]))
+    return positions
+
+
+def describe_live_engine():
+    """Imprime de onde vêm as funções que o jogo realmente chama."""
+    for fn in (ai.get_best_move, ai.evaluate_board, ai.SearchEngine.iterative_deepening):
+        _, line = inspect.getsourcelines(fn)
+        print(f"  {fn.__qualname__:<35} {inspect.getsourcefile(fn)}:{line}")
+    engine = ai.get_engine()
+    print(f"  avaliador: {type(engine.evaluator).__name__}  "
+          f"tabela: {engine.table.size} entradas ({engine.table.size_mb} MB)")
+
+
+def bench_difficulty(difficulty, positions, verbose=False):
+    """
+    Roda get_best_move em todas as posições com a profundidade da dificuldade e
+    sem limite de tempo. Retorna o total de nós (a assinatura da dificuldade).
+    """
+    engine = ai.get_engine()
+    base = ai.config_for(difficulty)
+    config = ai.SearchConfig(max_depth=base.max_depth, max_time=float("inf"),
+                             quiescence=base.quiescence, use_book=False, use_tablebase=False)
+    print(f"\nDificuldade {difficulty}: {config}")
+    original = ai.DIFFICULTY_CONFIGS.get(difficulty)
+    ai.DIFFICULTY_CONFIGS[difficulty] = config
+    total_nodes = total_probes = total_hits = 0
+    total_time = 0.0
+    depth_times = {}
+    try:
+        for index, (group, fen) in enumerate(positions):
+            board = chess.Board(fen)
+            engine.clear()
+            # Mesma ordem dos lances da raiz a cada execução
+            random.seed(index)
+            start = time.perf_counter()
+            move = ai.get_best_move(board, difficulty)
+            elapsed = time.perf_counter() - start
+            stats = ai.get_last_stats()
+            total_nodes += stats.nodes
+            total_probes += stats.tt_probes
+            total_hits += stats.tt_hits
+            total_time += elapsed
+            for depth, seconds, _ in stats.iterations:
+                depth_times.setdefault(depth, []).append(seconds)
+            if verbose:
+                print(f"  {index + 1:>2} {group:<10} {board.san(move):<7} prof {stats.depth}/{stats.seldepth}  "
+                      f"{stats.nodes:>8} nós  {elapsed:6.2f}s  {stats.nps:>8} nós/s")
+    finally:
+        # Dificuldade que não existia (ex.: 6) volta a cair no padrão de config_for
+        if original is None:
+            ai.DIFFICULTY_CONFIGS.pop(difficulty, None)
+        else:
+            ai.DIFFICULTY_CONFIGS[difficulty] = original
+
+    hit_rate = 100.0 * total_hits / total_probes if total_probes else 0.0
+    print(f"  nós: {total_nodes}  tempo: {total_time:.2f}s  "
+          f"nós/s: {total_nodes / max(total_time, 1e-9):.0f}  TT: {hit_rate:.1f}% de acertos")
+    times = "  ".join(f"p{depth} {sum(ts) / len(ts):.3f}s"
+                      for depth, ts in sorted(depth_times.items()))
+    print(f"  tempo médio até a profundidade: {times}")
+    print(f"  assinatura: {total_nodes}")
+    return total_nodes
+
+
+def run(difficulties, limit=None, verbose=False):
+    print("Motor ativo:")
+    describe_live_engine()
+    positions = load_positions()
+    if limit:
+        positions = positions[:limit]
+    print(f"{len(positions)} posições")
+    book_depth = ai.opening_book.max_ply
+    ai.set_book_depth(0)
+    signatures = []
+    try:
+        for difficulty in difficulties:
+            signatures.append(bench_difficulty(difficulty, positions, verbose))
+    finally:
+        ai.set_book_depth(book_depth)
+    print(f"\nAssinatura total: {sum(signatures)}")
+    return sum(signatures)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do motor de busca")
+    parser.add_argument("--difficulties", type=int, nargs="+", default=sorted(ai.DIFFICULTY_CONFIGS))
+    parser.add_argument("--limit", type=int, help="usa só as N primeiras posições")
+    parser.add_argument("--verbose", action="store_true", help="uma linha por posição")
+    args = parser.parse_args()
+    run(args.difficulties, args.limit, args.verbose)
+
+
+if __name__ == "__main__":
+    main()
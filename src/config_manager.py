@@ -18,7 +18,13 @@ class ConfigManager:
             "last_skin": "default",
             "difficulty": 2,
             "show_hints": True,
-            "auto_save": False
+            "auto_save": False,
+            "tt_size_mb": 16,  # Memória da tabela de transposição da IA
+            "book_depth": 16,  # Meios-lances em que a IA usa o livro de aberturas
+            "search_workers": 1,  # Processos da busca paralela (Lazy SMP); 1 = um núcleo
+            "ponder": True,  # IA pensa na resposta prevista durante a vez do jogador
+            "syzygy_path": "",  # Pasta com tablebases Syzygy (.rtbw/.rtbz); vazio = desligado
+            "search_log": False  # Grava as estatísticas de cada lance da IA em search_log.jsonl
         }
         self.config = self.defaults.copy()
         self.load()
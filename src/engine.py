@@ -1,6 +1,8 @@
 import pygame
 import chess
 
+from src.ai import new_game
+
 class Engine:
 	def __init__(self):
 		self.board = chess.Board()
@@ -19,6 +21,8 @@ class Engine:
 		self.start_time = pygame.time.get_ticks()
 		self.running = True
 		self.board.reset()
+		# A IA guarda o que aprendeu: a tabela é envelhecida, não apagada
+		new_game()
 		self.time_limit = time_limit
 		self.winner_on_time = None
 		if self.time_limit is not None:
@@ -52,6 +56,12 @@ class Engine:
 				self.winner_on_time = 'white'
 				self.stop()
 
+	def get_time_left(self):
+		"""Segundos restantes no relógio de quem joga, ou None em jogo sem tempo."""
+		if self.time_limit is None:
+			return None
+		return self.white_time if self.board.turn == chess.WHITE else self.black_time
+
 	def get_game_duration(self):
 		if self.start_time is None: return 0
 		return (pygame.time.get_ticks() - self.start_time) // 1000
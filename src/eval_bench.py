@@ -0,0 +1,80 @@
+"""
+Benchmark da avaliação estática: compara evaluate_position (bitboards) com a
+versão antiga que percorria as 64 casas, conferindo que os scores são iguais.
+
+Uso: python -m src.eval_bench [--games N] [--repeat N]
+"""
+import argparse
+import json
+import os
+import random
+import time
+
+import chess
+
+from src.evaluation import PIECE_SQUARE_MG, PIECE_SQUARE_EG, is_endgame, evaluate_position
+
+
+def evaluate_position_loop(board):
+    """
+    Cópia literal da evaluate_position anterior aos bitboards: percorre as 64
+    casas com piece_at e soma as tabelas pré-calculadas por [cor][tipo][casa].
+    A orientação das tabelas já era a atual, então os scores devem ser iguais.
+    """
+    num_queens = len(board.pieces(chess.QUEEN, chess.WHITE)) + len(board.pieces(chess.QUEEN, chess.BLACK))
+    num_rooks_minors = sum(len(board.pieces(pt, chess.WHITE)) + len(board.pieces(pt, chess.BLACK))
+                           for pt in (chess.KNIGHT, chess.BISHOP, chess.ROOK))
+    tables = PIECE_SQUARE_EG if is_endgame(num_queens, num_rooks_minors) else PIECE_SQUARE_MG
+    score = 0
+    for square in chess.SQUARES:
+        piece = board.piece_at(square)
+        if piece:
+            score += tables[piece.color][piece.piece_type][square]
+    return score
+
+
+def sample_positions(games, seed=0, puzzles_path=os.path.join("data", "puzzles.json")):
+    """Posições de partidas aleatórias (todas as fases) + as posições dos puzzles."""
+    rng = random.Random(seed)
+    boards = []
+    for _ in range(games):
+        board = chess.Board()
+        while not board.is_game_over() and len(board.move_stack) < 160:
+            board.push(rng.choice(list(board.legal_moves)))
+            boards.append(board.copy(stack=False))
+    if os.path.exists(puzzles_path):
+        with open(puzzles_path, "r", encoding="utf-8") as f:
+            for puzzle in json.load(f):
+                boards.append(chess.Board(puzzle["fen"]))
+    return boards
+
+
+def _time_per_call(fn, boards, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for board in boards:
+            fn(board)
+    return (time.perf_counter() - start) / (repeat * len(boards))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da avaliação estática")
+    parser.add_argument("--games", type=int, default=50, help="partidas aleatórias para amostrar posições")
+    parser.add_argument("--repeat", type=int, default=5, help="repetições da medição")
+    args = parser.parse_args()
+
+    boards = sample_positions(args.games)
+    mismatches = [b.fen() for b in boards if evaluate_position(b) != evaluate_position_loop(b)]
+    print(f"Posições: {len(boards)}  divergências: {len(mismatches)}")
+    for fen in mismatches[:10]:
+        print(f"  DIVERGE: {fen}")
+
+    old = _time_per_call(evaluate_position_loop, boards, args.repeat)
+    new = _time_per_call(evaluate_position, boards, args.repeat)
+    print(f"Laço 64 casas: {old * 1e6:8.2f} us/chamada")
+    print(f"Bitboards:     {new * 1e6:8.2f} us/chamada  ({old / new:.1f}x)")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
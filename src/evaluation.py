@@ -0,0 +1,269 @@
+import chess
+
+# Valores Materiais
+piece_values = {
+    chess.PAWN: 100,
+    chess.KNIGHT: 320,
+    chess.BISHOP: 330,
+    chess.ROOK: 500,
+    chess.QUEEN: 900,
+    chess.KING: 20000
+}
+
+# --- TABELAS POSICIONAIS (PST) ---
+# Valores positivos incentivam a peça a ir para aquela casa.
+# As tabelas estão escritas como o tabuleiro é visto pelas brancas:
+# a primeira linha é a 8ª fileira (a8..h8) e a última é a 1ª (a1..h1).
+# A lógica é espelhada para as pretas automaticamente.
+
+# Peões: Incentiva avançar, mas pune peões centrais muito adiantados sem apoio
+pawns_table = [
+    0,  0,  0,  0,  0,  0,  0,  0,
+    50, 50, 50, 50, 50, 50, 50, 50,
+    10, 10, 20, 30, 30, 20, 10, 10,
+    5,  5, 10, 25, 25, 10,  5,  5,
+    0,  0,  0, 20, 20,  0,  0,  0,
+    5, -5,-10,  0,  0,-10, -5,  5,
+    5, 10, 10,-20,-20, 10, 10,  5,
+    0,  0,  0,  0,  0,  0,  0,  0
+]
+
+# Cavalos: Amam o centro, odeiam as bordas
+knights_table = [
+    -50,-40,-30,-30,-30,-30,-40,-50,
+    -40,-20,  0,  0,  0,  0,-20,-40,
+    -30,  0, 10, 15, 15, 10,  0,-30,
+    -30,  5, 15, 20, 20, 15,  5,-30,
+    -30,  0, 15, 20, 20, 15,  0,-30,
+    -30,  5, 10, 15, 15, 10,  5,-30,
+    -40,-20,  0,  5,  5,  0,-20,-40,
+    -50,-40,-30,-30,-30,-30,-40,-50,
+]
+
+# Bispos: Gostam de diagonais longas e odeiam cantos presos
+bishops_table = [
+    -20,-10,-10,-10,-10,-10,-10,-20,
+    -10,  0,  0,  0,  0,  0,  0,-10,
+    -10,  0,  5, 10, 10,  5,  0,-10,
+    -10,  5,  5, 10, 10,  5,  5,-10,
+    -10,  0, 10, 10, 10, 10,  0,-10,
+    -10, 10, 10, 10, 10, 10, 10,-10,
+    -10,  5,  0,  0,  0,  0,  5,-10,
+    -20,-10,-10,-10,-10,-10,-10,-20,
+]
+
+# Torres: Gostam da 7ª fila e colunas centrais
+rooks_table = [
+    0,  0,  0,  0,  0,  0,  0,  0,
+    5, 10, 10, 10, 10, 10, 10,  5,
+    -5,  0,  0,  0,  0,  0,  0, -5,
+    -5,  0,  0,  0,  0,  0,  0, -5,
+    -5,  0,  0,  0,  0,  0,  0, -5,
+    -5,  0,  0,  0,  0,  0,  0, -5,
+    -5,  0,  0,  0,  0,  0,  0, -5,
+    0,  0,  0,  5,  5,  0,  0,  0
+]
+
+# Rainha: Quase igual ao Bispo, mas com cuidado para não sair cedo demais
+queens_table = [
+    -20,-10,-10, -5, -5,-10,-10,-20,
+    -10,  0,  0,  0,  0,  0,  0,-10,
+    -10,  0,  5,  5,  5,  5,  0,-10,
+     -5,  0,  5,  5,  5,  5,  0, -5,
+      0,  0,  5,  5,  5,  5,  0, -5,
+    -10,  5,  5,  5,  5,  5,  0,-10,
+    -10,  0,  5,  0,  0,  0,  0,-10,
+    -20,-10,-10, -5, -5,-10,-10,-20
+]
+
+# Rei (Meio Jogo): Esconda-se atrás dos peões! (Roque)
+king_mid_table = [
+    -30,-40,-40,-50,-50,-40,-40,-30,
+    -30,-40,-40,-50,-50,-40,-40,-30,
+    -30,-40,-40,-50,-50,-40,-40,-30,
+    -30,-40,-40,-50,-50,-40,-40,-30,
+    -20,-30,-30,-40,-40,-30,-30,-20,
+    -10,-20,-20,-20,-20,-20,-20,-10,
+     20, 20,  0,  0,  0,  0, 20, 20,
+     20, 30, 10,  0,  0, 10, 30, 20
+]
+
+# Rei (Final de Jogo): Centralize o Rei!
+king_end_table = [
+    -50,-40,-30,-20,-20,-30,-40,-50,
+    -30,-20,-10,  0,  0,-10,-20,-30,
+    -30,-10, 20, 30, 30, 20,-10,-30,
+    -30,-10, 30, 40, 40, 30,-10,-30,
+    -30,-10, 30, 40, 40, 30,-10,-30,
+    -30,-10, 20, 30, 30, 20,-10,-30,
+    -30,-30,  0,  0,  0,  0,-30,-30,
+    -50,-30,-30,-30,-30,-30,-30,-50
+]
+
+
+def _table_index(square, color):
+    """Índice na tabela (1ª linha = 8ª fileira) para uma casa do python-chess (a1 = 0)."""
+    return chess.square_mirror(square) if color == chess.WHITE else square
+
+
+def _build_tables(king_table, with_material):
+    """
+    Pré-calcula o valor de cada peça por [cor][tipo][casa], já com o sinal do
+    ponto de vista das brancas (peças pretas valem negativo).
+    with_material=False deixa só a parte posicional (PST).
+    """
+    tables = {
+        chess.PAWN: pawns_table,
+        chess.KNIGHT: knights_table,
+        chess.BISHOP: bishops_table,
+        chess.ROOK: rooks_table,
+        chess.QUEEN: queens_table,
+        chess.KING: king_table,
+    }
+    result = {}
+    for color in chess.COLORS:
+        sign = 1 if color == chess.WHITE else -1
+        result[color] = [None] * 7
+        for piece_type, table in tables.items():
+            material = piece_values[piece_type] if with_material else 0
+            result[color][piece_type] = [
+                sign * (material + table[_table_index(sq, color)])
+                for sq in chess.SQUARES
+            ]
+    return result
+
+# Meio-jogo e final só diferem na tabela do Rei
+PIECE_SQUARE_MG = _build_tables(king_mid_table, with_material=True)
+PIECE_SQUARE_EG = _build_tables(king_end_table, with_material=True)
+
+
+def is_endgame(num_queens, num_rooks_minors):
+    """Final de jogo: sem rainhas, ou só as rainhas e no máximo uma peça menor/torre."""
+    return num_queens == 0 or (num_queens == 2 and num_rooks_minors <= 1)
+
+
+# Tabelas achatadas para as duas cores: nada de square_mirror no laço quente
+POSITIONAL_MG = _build_tables(king_mid_table, with_material=False)
+POSITIONAL_EG = _build_tables(king_end_table, with_material=False)
+
+
+def evaluate_position(board):
+    """
+    Material + PST do ponto de vista das BRANCAS, sem checar mate/afogamento.
+    Trabalha direto nos bitboards: material por popcount de cada máscara e a
+    parte posicional somando a tabela pré-calculada só nas casas ocupadas.
+    """
+    white = board.occupied_co[chess.WHITE]
+    black = board.occupied_co[chess.BLACK]
+    popcount = chess.popcount
+    if is_endgame(popcount(board.queens), popcount(board.rooks | board.bishops | board.knights)):
+        positional = POSITIONAL_EG
+    else:
+        positional = POSITIONAL_MG
+    white_tables = positional[chess.WHITE]
+    black_tables = positional[chess.BLACK]
+
+    score = 0
+    for piece_type, mask in ((chess.PAWN, board.pawns), (chess.KNIGHT, board.knights),
+                             (chess.BISHOP, board.bishops), (chess.ROOK, board.rooks),
+                             (chess.QUEEN, board.queens), (chess.KING, board.kings)):
+        w = mask & white
+        b = mask & black
+        score += piece_values[piece_type] * (popcount(w) - popcount(b))
+        table = white_tables[piece_type]
+        for sq in chess.scan_reversed(w):
+            score += table[sq]
+        table = black_tables[piece_type]
+        for sq in chess.scan_reversed(b):
+            score += table[sq]
+    return score
+
+
+class IncrementalEvaluator:
+    """
+    Mantém as somas de material + PST (meio-jogo e final) atualizadas a cada
+    lance da busca, de forma que avaliar uma folha custe O(1).
+
+    Uso na busca:
+        evaluator.reset(board)          # uma vez na raiz
+        evaluator.push(board, move)     # ANTES de board.push(move)
+        evaluator.pop()                 # junto com board.pop()
+        evaluator.score()               # avaliação do ponto de vista das brancas
+    """
+
+    def __init__(self, board=None):
+        self._stack = []
+        self.mg = 0
+        self.eg = 0
+        self.num_queens = 0
+        self.num_rooks_minors = 0
+        if board is not None:
+            self.reset(board)
+
+    def reset(self, board):
+        self._stack = []
+        self.mg = 0
+        self.eg = 0
+        for color in chess.COLORS:
+            occupied = board.occupied_co[color]
+            for piece_type in chess.PIECE_TYPES:
+                mg_table = PIECE_SQUARE_MG[color][piece_type]
+                eg_table = PIECE_SQUARE_EG[color][piece_type]
+                for sq in chess.scan_reversed(board.pieces_mask(piece_type, color) & occupied):
+                    self.mg += mg_table[sq]
+                    self.eg += eg_table[sq]
+        self.num_queens = chess.popcount(board.queens)
+        self.num_rooks_minors = chess.popcount(board.rooks | board.bishops | board.knights)
+
+    def push(self, board, move):
+        """Atualiza as somas para o lance `move` (chamar antes de board.push)."""
+        self._stack.append((self.mg, self.eg, self.num_queens, self.num_rooks_minors))
+        mg_table = PIECE_SQUARE_MG
+        eg_table = PIECE_SQUARE_EG
+        color = board.turn
+        from_sq = move.from_square
+        to_sq = move.to_square
+        piece_type = board.piece_type_at(from_sq)
+
+        # Peça que sai da origem e chega ao destino (promovida, se for o caso)
+        new_type = move.promotion or piece_type
+        mg = mg_table[color][new_type][to_sq] - mg_table[color][piece_type][from_sq]
+        eg = eg_table[color][new_type][to_sq] - eg_table[color][piece_type][from_sq]
+        if move.promotion:
+            if move.promotion == chess.QUEEN:
+                self.num_queens += 1
+            else:
+                self.num_rooks_minors += 1
+
+        if piece_type == chess.KING and abs(from_sq - to_sq) == 2:
+            # Roque: a torre também muda de casa
+            if to_sq > from_sq:
+                rook_from, rook_to = to_sq + 1, to_sq - 1
+            else:
+                rook_from, rook_to = to_sq - 2, to_sq + 1
+            mg += mg_table[color][chess.ROOK][rook_to] - mg_table[color][chess.ROOK][rook_from]
+            eg += eg_table[color][chess.ROOK][rook_to] - eg_table[color][chess.ROOK][rook_from]
+        else:
+            captured_sq = to_sq
+            captured = board.piece_type_at(to_sq)
+            if not captured and piece_type == chess.PAWN and to_sq == board.ep_square:
+                captured_sq = to_sq - 8 if color == chess.WHITE else to_sq + 8
+                captured = chess.PAWN
+            if captured:
+                mg -= mg_table[not color][captured][captured_sq]
+                eg -= eg_table[not color][captured][captured_sq]
+                if captured == chess.QUEEN:
+                    self.num_queens -= 1
+                elif captured != chess.PAWN:
+                    self.num_rooks_minors -= 1
+
+        self.mg += mg
+        self.eg += eg
+
+    def pop(self):
+        self.mg, self.eg, self.num_queens, self.num_rooks_minors = self._stack.pop()
+
+    def score(self):
+        if is_endgame(self.num_queens, self.num_rooks_minors):
+            return self.eg
+        return self.mg
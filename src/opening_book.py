@@ -0,0 +1,63 @@
+import os
+import random
+
+import chess
+import chess.polyglot
+
+DEFAULT_BOOK_PATH = os.path.join("data", "baron30.bin")
+DEFAULT_BOOK_DEPTH = 16  # Meios-lances (plies) em que o livro é consultado
+
+# Expoente aplicado ao peso Polyglot de cada lance, por dificuldade:
+# 0 = todos os lances do livro igualmente prováveis (mais variedade),
+# valores maiores concentram a escolha nos lances mais jogados/fortes.
+DIFFICULTY_WEIGHT_EXPONENT = {2: 0.0, 3: 0.5, 4: 1.0, 5: 2.0}
+
+
+class OpeningBook:
+    """
+    Livro de aberturas Polyglot (.bin) lido via mmap.
+
+    O arquivo não é carregado em objetos Python: cada consulta faz uma busca
+    binária nas chaves ordenadas (chess.polyglot.MemoryMappedReader) e lê só
+    as entradas daquela posição.
+    """
+
+    def __init__(self, path=DEFAULT_BOOK_PATH, max_ply=DEFAULT_BOOK_DEPTH):
+        self.path = path
+        self.max_ply = max_ply
+        self._reader = None
+        self._unavailable = False
+
+    def _open(self):
+        if self._reader is None and not self._unavailable:
+            try:
+                self._reader = chess.polyglot.MemoryMappedReader(self.path)
+            except (OSError, IOError) as e:
+                print(f"Aviso: livro de aberturas indisponível ({self.path}): {e}")
+                self._unavailable = True
+        return self._reader
+
+    def close(self):
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def entries(self, board):
+        """Lances do livro para a posição (lista de chess.polyglot.Entry)."""
+        if board.ply() >= self.max_ply:
+            return []
+        reader = self._open()
+        if reader is None:
+            return []
+        return list(reader.find_all(board))
+
+    def choose_move(self, board, difficulty, rng=random):
+        """Sorteia um lance do livro ponderado pela dificuldade, ou None se fora do livro."""
+        entries = self.entries(board)
+        if not entries:
+            return None
+        exponent = DIFFICULTY_WEIGHT_EXPONENT.get(difficulty, DIFFICULTY_WEIGHT_EXPONENT[5])
+        weights = [entry.weight ** exponent for entry in entries]
+        move = rng.choices(entries, weights=weights)[0].move
+        # Segurança extra: o livro pode ter colisões de hash
+        return move if board.is_legal(move) else None
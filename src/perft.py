@@ -0,0 +1,158 @@
+"""
+Perft: conta as folhas da árvore de lances legais até uma profundidade e
+compara com os valores de referência conhecidos. Mede a geração de lances e
+o push/pop do tabuleiro (o que a busca da IA usa) e detecta regressões de
+corretude e de velocidade.
+
+Uso: python -m src.perft [--depth N] [--workers N] [--position NOME | --fen FEN] [--divide] [--zobrist]
+"""
+import argparse
+import multiprocessing
+import sys
+import time
+
+import chess
+
+from src.zobrist import board_key, push_move
+
+# Posições de referência (chessprogramming.org/Perft_Results): nós por profundidade 1, 2, 3...
+REFERENCE_POSITIONS = [
+    ("inicial", chess.STARTING_FEN,
+     [20, 400, 8902, 197281, 4865609]),
+    ("kiwipete", "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+     [48, 2039, 97862, 4085603]),
+    ("final-torre", "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+     [14, 191, 2812, 43238, 674624]),
+    ("promocoes", "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+     [6, 264, 9467, 422333]),
+    ("xeques", "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+     [44, 1486, 62379, 2103487]),
+    ("meio-jogo", "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+     [46, 2079, 89890, 3894594]),
+]
+
+
+def perft(board, depth):
+    """Nº de posições a `depth` meios-lances (na última ply só conta os lances)."""
+    if depth == 0:
+        return 1
+    if depth == 1:
+        return board.legal_moves.count()
+    nodes = 0
+    for move in board.legal_moves:
+        board.push(move)
+        nodes += perft(board, depth - 1)
+        board.pop()
+    return nodes
+
+
+def perft_zobrist(board, depth, key):
+    """
+    Perft usando zobrist.push_move (como a busca da IA), conferindo a chave
+    incremental com a chave completa em cada posição. Levanta ValueError na
+    primeira divergência.
+    """
+    if key != board_key(board):
+        raise ValueError(f"chave Zobrist incremental errada em {board.fen()}")
+    if depth == 0:
+        return 1
+    nodes = 0
+    for move in board.legal_moves:
+        child_key = push_move(board, key, move)
+        nodes += perft_zobrist(board, depth - 1, child_key)
+        board.pop()
+    return nodes
+
+
+def _perft_fen(args):
+    fen, depth, zobrist = args
+    board = chess.Board(fen)
+    if zobrist:
+        return perft_zobrist(board, depth, board_key(board))
+    return perft(board, depth)
+
+
+def divide(board, depth, pool=None, zobrist=False):
+    """
+    Perft separado por lance da raiz: [(lance, nós)]. Com um pool de
+    processos, cada lance da raiz vira uma tarefa independente.
+    """
+    moves = list(board.legal_moves)
+    tasks = []
+    for move in moves:
+        board.push(move)
+        tasks.append((board.fen(), depth - 1, zobrist))
+        board.pop()
+    if pool is None:
+        counts = [_perft_fen(task) for task in tasks]
+    else:
+        counts = pool.map(_perft_fen, tasks)
+    return list(zip(moves, counts))
+
+
+def run(positions, depth, workers=1, show_divide=False, zobrist=False):
+    """Roda o perft em cada posição; retorna True se todas bateram com a referência."""
+    pool = multiprocessing.Pool(workers) if workers > 1 else None
+    all_ok = True
+    total_nodes = 0
+    total_time = 0.0
+    try:
+        mode = ", conferindo Zobrist" if zobrist else ""
+        print(f"Perft profundidade {depth} ({workers} processo(s){mode})")
+        for name, fen, expected in positions:
+            board = chess.Board(fen)
+            d = min(depth, len(expected)) if expected else depth
+            start = time.perf_counter()
+            if pool is None and not show_divide:
+                nodes = _perft_fen((fen, d, zobrist))
+                split = None
+            else:
+                split = divide(board, d, pool, zobrist)
+                nodes = sum(count for _, count in split)
+            elapsed = time.perf_counter() - start
+            total_nodes += nodes
+            total_time += elapsed
+            if expected:
+                ok = nodes == expected[d - 1]
+                status = "OK" if ok else f"ERRO (esperado {expected[d - 1]})"
+                all_ok = all_ok and ok
+            else:
+                status = "-"
+            print(f"  {name:<12} prof {d}  {nodes:>10} nós  {elapsed:7.2f}s  "
+                  f"{nodes / max(elapsed, 1e-9):>9.0f} nós/s  {status}")
+            if show_divide and split:
+                for move, count in split:
+                    print(f"      {board.san(move):<7} {count}")
+        print(f"  total: {total_nodes} nós em {total_time:.2f}s "
+              f"({total_nodes / max(total_time, 1e-9):.0f} nós/s)")
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return all_ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Perft: corretude e velocidade da geração de lances")
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processos; >1 divide o trabalho pelos lances da raiz")
+    parser.add_argument("--position", choices=[name for name, _, _ in REFERENCE_POSITIONS])
+    parser.add_argument("--fen", help="posição própria (sem valores de referência)")
+    parser.add_argument("--divide", action="store_true", help="mostra os nós por lance da raiz")
+    parser.add_argument("--zobrist", action="store_true",
+                        help="usa zobrist.push_move e confere a chave em cada posição (mais lento)")
+    args = parser.parse_args()
+
+    if args.fen:
+        positions = [("fen", args.fen, None)]
+    elif args.position:
+        positions = [p for p in REFERENCE_POSITIONS if p[0] == args.position]
+    else:
+        positions = REFERENCE_POSITIONS
+    ok = run(positions, args.depth, max(1, args.workers), args.divide, args.zobrist)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
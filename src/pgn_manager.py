@@ -13,17 +13,24 @@ class PGNManager:
             self.data_dir = data_dir
         os.makedirs(self.data_dir, exist_ok=True)
 
-    def save_game(self, board, white_name, black_name, result):
-        """Salva o histórico do tabuleiro atual em um arquivo PGN."""
+    def save_game(self, board, white_name, black_name, result, event="Partida Casual PyChess",
+                  round_number=1, headers=None, filename=None):
+        """
+        Salva o histórico do tabuleiro atual em um arquivo PGN.
+        headers: cabeçalhos extras (ex.: TimeControl, Termination).
+        filename: nome do arquivo; padrão: game_<data>_<hora>.pgn
+        """
         game = chess.pgn.Game()
         # Cabeçalhos obrigatórios
-        game.headers["Event"] = "Partida Casual PyChess"
+        game.headers["Event"] = event
         game.headers["Site"] = "Local"
         game.headers["Date"] = datetime.now().strftime("%Y.%m.%d")
-        game.headers["Round"] = "1"
+        game.headers["Round"] = str(round_number)
         game.headers["White"] = white_name
         game.headers["Black"] = black_name
         game.headers["Result"] = result
+        for name, value in (headers or {}).items():
+            game.headers[name] = str(value)
 
         # Reconstrói a árvore de movimentos a partir do move_stack do tabuleiro
         node = game
@@ -31,7 +38,8 @@ class PGNManager:
             node = node.add_variation(move)
 
         # Gera nome de arquivo único
-        filename = f"game_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pgn"
+        if filename is None:
+            filename = f"game_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pgn"
         filepath = os.path.join(self.data_dir, filename)
 
         with open(filepath, "w", encoding="utf-8") as f:
@@ -0,0 +1,257 @@
+import threading
+
+from src.ai import (search_best_move, ponder_best_move, predict_reply, config_for,
+                    compute_time_budget, get_engine, get_last_stats, record_stats)
+
+
+class _SearchJob:
+    """Uma busca em andamento: snapshot da posição + evento de conclusão."""
+
+    def __init__(self, board):
+        self.fen = board.fen()
+        self.done = threading.Event()
+        self.move = None
+        self.error = None
+        # Sinal de parada e a thread da busca (cancel espera ela sair);
+        # missed: busca descartada (previsão errada do pondering ou cancelamento)
+        self.stop = threading.Event()
+        self.thread = None
+        self.missed = False
+        self.time_left = None
+        # Estatísticas do lance, registradas só quando ele é usado (take_result)
+        self.difficulty = None
+        self.stats = None
+
+
+class SearchService:
+    """
+    Executa a busca da IA em uma thread separada para que o loop do pygame
+    continue desenhando, contando o relógio e lendo eventos enquanto a IA pensa.
+
+    Uso a cada frame:
+        if not service.busy: service.start(board, dificuldade)
+        elif service.done(): move = service.take_result(board)
+
+    Pondering: depois do lance da IA, ponder(board, dificuldade) busca em
+    segundo plano a posição após a resposta prevista do humano. Se ele jogar
+    o lance previsto, start() reaproveita essa busca (e a tabela já aquecida);
+    caso contrário ela é interrompida e uma busca normal começa.
+
+    A busca pode ser interrompida a qualquer momento (a cada
+    NODES_PER_CLOCK_CHECK nós): move_now() faz a IA jogar o melhor lance já
+    encontrado; cancel() e cancel_if_changed(board) a descartam.
+
+    Dica (tecla H): hint(board, dificuldade) busca o lance do humano também
+    em segundo plano, lido a cada frame com take_hint(board).
+    """
+
+    def __init__(self):
+        self._job = None
+        self._ponder = None
+        self._hint = None
+
+    @property
+    def busy(self):
+        """True se existe uma busca pendente (rodando ou com resultado não lido)."""
+        return self._job is not None
+
+    @property
+    def hinting(self):
+        """True se existe uma dica pendente (na fila, rodando ou com resultado não lido)."""
+        return self._hint is not None
+
+    def start(self, board, difficulty, time_left=None):
+        """
+        Dispara a busca sobre uma CÓPIA do tabuleiro (o original segue livre para a UI).
+        time_left: relógio de quem joga, usado para o orçamento de tempo do lance.
+        """
+        self._drop_hint() # O motor é compartilhado: a vez agora é da IA
+        ponder = self._ponder
+        self._ponder = None
+        if ponder is not None:
+            if ponder.fen == board.fen() and not (ponder.done.is_set() and ponder.move is None):
+                # Acertou a previsão: a busca em andamento vira a busca deste lance
+                self._job = ponder
+                if not ponder.done.is_set():
+                    ponder.time_left = time_left
+                    budget = compute_time_budget(config_for(difficulty), time_left)
+                    timer = threading.Timer(budget, ponder.stop.set)
+                    timer.daemon = True
+                    timer.start()
+                return
+            self._stop_job(ponder)
+
+        job = _SearchJob(board)
+        job.difficulty = difficulty
+        self._job = job
+        snapshot = board.copy()
+        # daemon=True: fechar a janela não espera a busca terminar
+        job.thread = threading.Thread(target=self._run, args=(job, snapshot, difficulty, time_left),
+                                      name="busca-ia", daemon=True)
+        job.thread.start()
+
+    def _run(self, job, board, difficulty, time_left):
+        try:
+            job.move, job.stats = search_best_move(board, difficulty, time_left, job.stop)
+        except Exception as e:
+            job.error = e
+        finally:
+            job.done.set()
+
+    def ponder(self, board, difficulty):
+        """
+        Começa a pensar no tempo do humano. board: posição com o humano a jogar,
+        logo após o lance da IA. Não faz nada sem previsão (ex.: lance do livro).
+        """
+        if self._ponder is not None or self._job is not None or self._hint is not None or difficulty == 1:
+            return
+        predicted = predict_reply(board)
+        if predicted is None:
+            return
+        snapshot = board.copy()
+        snapshot.push(predicted)
+        job = _SearchJob(snapshot)
+        job.difficulty = difficulty
+        job.thread = threading.Thread(target=self._run_ponder, args=(job, snapshot, difficulty),
+                                      name="ponder-ia", daemon=True)
+        self._ponder = job
+        job.thread.start()
+
+    def _run_ponder(self, job, board, difficulty):
+        try:
+            job.move, job.stats = ponder_best_move(board, difficulty, job.stop)
+        except Exception as e:
+            job.error = e
+        finally:
+            job.done.set()
+
+    def hint(self, board, difficulty):
+        """
+        Pede uma dica para `board` (vez do humano). A busca roda em outra thread
+        e não registra estatísticas (não é um lance da IA). Recusada (False) se
+        a IA está buscando o próprio lance; com o pondering rodando, fica na
+        fila até ele terminar (o motor é compartilhado).
+        """
+        if self._job is not None:
+            return False
+        if self._hint is not None:
+            if self._hint.fen == board.fen():
+                return True
+            self._drop_hint()
+        job = _SearchJob(board)
+        job.difficulty = difficulty
+        job.thread = threading.Thread(target=self._run, args=(job, board.copy(), difficulty, None),
+                                      name="dica-ia", daemon=True)
+        self._hint = job
+        self._start_hint()
+        return True
+
+    def _start_hint(self):
+        """Começa a dica da fila assim que o motor estiver livre (pondering terminado)."""
+        job = self._hint
+        if job is not None and job.thread.ident is None:
+            if self._ponder is None or self._ponder.done.is_set():
+                job.thread.start()
+
+    def take_hint(self, board):
+        """
+        Não bloqueia: lance da dica quando pronto (e libera o serviço), senão
+        None. Descartada se o tabuleiro mudou desde o pedido.
+        """
+        job = self._hint
+        if job is None:
+            return None
+        if board.fen() != job.fen:
+            self._drop_hint()
+            return None
+        self._start_hint()
+        if not job.done.is_set():
+            return None
+        self._hint = None
+        if job.error is not None:
+            print(f"Erro na dica da IA: {job.error}")
+            return None
+        return job.move
+
+    def _drop_hint(self):
+        if self._hint is not None:
+            self._stop_job(self._hint)
+            self._hint = None
+
+    def _stop_job(self, job):
+        """Descarta a busca: pede para ela parar e espera a thread sair (o motor é compartilhado)."""
+        job.missed = True
+        job.stop.set()
+        # Dica ainda na fila: a thread nem começou
+        if job.thread.ident is not None:
+            job.thread.join()
+
+    def done(self):
+        """Não bloqueia: indica se a busca atual já terminou."""
+        return self._job is not None and self._job.done.is_set()
+
+    def take_result(self, board):
+        """
+        Retorna o lance calculado e libera o serviço.
+        Se o tabuleiro mudou desde o início da busca (undo, menu, novo jogo),
+        o resultado é descartado e None é retornado. Só o lance devolvido aqui
+        tem as estatísticas registradas (get_last_stats e log da busca).
+        """
+        job = self._job
+        if job is None or not job.done.is_set():
+            return None
+        self._job = None
+        if job.error is not None:
+            print(f"Erro na busca da IA: {job.error}")
+            return None
+        if board.fen() != job.fen:
+            return None
+        if job.stats is not None:
+            record_stats(board, job.difficulty, job.stats)
+        return job.move
+
+    def live_stats(self):
+        """
+        SearchStats da busca em andamento (atualizado ao vivo pela thread da
+        busca) ou, sem busca rodando, do último lance. Só leitura, não bloqueia.
+        """
+        if self._job is not None and not self._job.done.is_set():
+            return get_engine().stats
+        return get_last_stats()
+
+    def stop_pondering(self):
+        """Para o pondering (ex.: desfazer lance, que invalida a previsão)."""
+        if self._ponder is not None:
+            self._stop_job(self._ponder)
+            self._ponder = None
+
+    def move_now(self):
+        """
+        "Jogue já": encerra a busca atual, que termina com o melhor lance
+        encontrado até agora (lido normalmente por done()/take_result()).
+        """
+        if self._job is not None:
+            self._job.stop.set()
+
+    def cancel(self):
+        """
+        Interrompe e descarta a busca atual (e o pondering e a dica). Espera a thread
+        sair (no máximo alguns ms): o motor é compartilhado, e uma nova busca
+        não pode começar enquanto a anterior ainda roda.
+        """
+        job = self._job
+        self._job = None
+        if job is not None:
+            self._stop_job(job)
+        self.stop_pondering()
+        self._drop_hint()
+
+    def cancel_if_changed(self, board):
+        """Cancela a busca em andamento se `board` não é mais a posição pesquisada (undo, menu...)."""
+        if self._hint is not None and board.fen() != self._hint.fen:
+            self._drop_hint()
+        job = self._job
+        if job is not None and not job.done.is_set() and board.fen() != job.fen:
+            self.cancel()
+            return True
+        return False
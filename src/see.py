@@ -0,0 +1,71 @@
+import chess
+
+from src.evaluation import piece_values
+
+
+def _least_valuable(board, attackers):
+    """(tipo, casa) da peça menos valiosa em `attackers`, ou (None, None)."""
+    for piece_type, pieces in ((chess.PAWN, board.pawns), (chess.KNIGHT, board.knights),
+                               (chess.BISHOP, board.bishops), (chess.ROOK, board.rooks),
+                               (chess.QUEEN, board.queens), (chess.KING, board.kings)):
+        bb = attackers & pieces
+        if bb:
+            return piece_type, chess.lsb(bb)
+    return None, None
+
+
+def see(board, move):
+    """
+    Static Exchange Evaluation: saldo de material (em centipeões, para quem
+    joga) da sequência de capturas na casa de destino iniciada por `move`,
+    supondo que cada lado recaptura sempre com a peça menos valiosa e pode
+    parar a troca quando quiser. Ataques em raio-X (peças atrás das que já
+    capturaram) são considerados; cravadas não.
+    """
+    to_sq = move.to_square
+    occupied = board.occupied ^ chess.BB_SQUARES[move.from_square]
+    if board.is_en_passant(move):
+        captured = chess.PAWN
+        occupied ^= chess.BB_SQUARES[to_sq - 8 if board.turn == chess.WHITE else to_sq + 8]
+    else:
+        captured = board.piece_type_at(to_sq)
+
+    gains = [piece_values[captured] if captured else 0]
+    on_square = board.piece_type_at(move.from_square)
+    if move.promotion:
+        gains[0] += piece_values[move.promotion] - piece_values[chess.PAWN]
+        on_square = move.promotion
+
+    color = not board.turn
+    while True:
+        attackers = board.attackers_mask(color, to_sq, occupied) & occupied
+        if not attackers:
+            break
+        piece_type, square = _least_valuable(board, attackers)
+        # O rei só recaptura se o adversário não tiver mais nada atacando a casa
+        if piece_type == chess.KING and board.attackers_mask(not color, to_sq, occupied) & occupied:
+            break
+        # Ganho especulativo: captura a peça na casa e fica exposto à próxima
+        gains.append(piece_values[on_square] - gains[-1])
+        on_square = piece_type
+        occupied ^= chess.BB_SQUARES[square]
+        color = not color
+
+    # Cada lado escolhe entre continuar a troca ou parar (minimax da lista de ganhos)
+    for i in range(len(gains) - 1, 0, -1):
+        gains[i - 1] = -max(-gains[i - 1], gains[i])
+    return gains[0]
+
+
+def is_losing_capture(board, move):
+    """
+    True se a captura perde material. Atalho: tomar uma peça de valor igual
+    ou maior nunca perde, então só chama see() quando o atacante vale mais.
+    """
+    if move.promotion:
+        return see(board, move) < 0
+    victim = board.piece_type_at(move.to_square) or chess.PAWN
+    attacker = board.piece_type_at(move.from_square)
+    if piece_values[attacker] <= piece_values[victim]:
+        return False
+    return see(board, move) < 0
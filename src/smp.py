@@ -0,0 +1,111 @@
+import multiprocessing
+import queue
+import random
+
+from src.ai import SearchEngine
+from src.tablebase import EndgameTablebase
+from src.transposition import TranspositionTable, allocate_shared_buffer
+
+# Quanto esperar (s) pela resposta de cada auxiliar depois do sinal de parada
+RESULT_TIMEOUT = 1.0
+
+
+def _helper_main(worker_id, buffer, size_mb, tablebase_path, jobs, results, stop_event):
+    """
+    Loop de um processo auxiliar: recebe posições, busca com a tabela
+    compartilhada até o sinal de parada e devolve o resultado mais profundo.
+    """
+    engine = SearchEngine(table=TranspositionTable(size_mb, buffer=buffer),
+                          tablebase=EndgameTablebase(tablebase_path))
+    # Ordem dos lances da raiz diferente em cada auxiliar
+    rng = random.Random(worker_id)
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        search_id, board, config, budget, generation = job
+        engine.table.generation = generation
+        # Metade dos auxiliares começa uma profundidade à frente (diversifica a árvore)
+        start_depth = 1 + worker_id % 2
+        try:
+            move, depth, value = engine.iterative_deepening(
+                board, config, budget, start_depth=start_depth,
+                stop_event=stop_event, rng=rng, until_stopped=True)
+        except Exception as e:
+            print(f"Erro no processo de busca {worker_id}: {e}")
+            move, depth, value = None, 0, 0
+        results.put((search_id, worker_id, move, depth, value))
+
+
+class LazySMP:
+    """
+    Busca paralela "Lazy SMP": N processos pesquisam a MESMA raiz ao mesmo
+    tempo, trocando informação apenas pela tabela de transposição compartilhada
+    (memória multiprocessing, sem locks). O processo principal também busca;
+    vence o lance da busca que completou a maior profundidade.
+
+    Escritas concorrentes podem, raramente, corromper uma entrada da tabela;
+    a busca já confere a legalidade do lance guardado antes de usá-lo.
+    """
+
+    def __init__(self, workers, size_mb, tablebase_path=None):
+        self.workers = workers
+        self.buffer = allocate_shared_buffer(size_mb)
+        self.table = TranspositionTable(size_mb, buffer=self.buffer)
+        self.stop_event = multiprocessing.Event()
+        self.results = multiprocessing.Queue()
+        self.jobs = []
+        self.processes = []
+        self._search_id = 0
+        # O processo principal é o "auxiliar 0": cria workers - 1 processos
+        for worker_id in range(1, workers):
+            jobs = multiprocessing.Queue()
+            process = multiprocessing.Process(
+                target=_helper_main,
+                args=(worker_id, self.buffer, size_mb, tablebase_path, jobs, self.results, self.stop_event),
+                name=f"busca-ia-{worker_id}", daemon=True)
+            process.start()
+            self.jobs.append(jobs)
+            self.processes.append(process)
+
+    def search(self, engine, board, config, budget, stop_event=None):
+        """
+        Busca em todos os processos e retorna o lance da busca mais profunda.
+        engine: o SearchEngine do processo principal (usa self.table).
+        stop_event: threading.Event que encerra a busca antes do tempo.
+        """
+        self._search_id += 1
+        self.stop_event.clear()
+        # A fila serializa em outra thread: envia uma cópia, pois a busca
+        # local abaixo faz push/pop no tabuleiro original
+        snapshot = board.copy()
+        for jobs in self.jobs:
+            jobs.put((self._search_id, snapshot, config, budget, self.table.generation))
+
+        move, depth, _ = engine.iterative_deepening(board, config, budget, stop_event=stop_event)
+        self.stop_event.set()
+
+        best_move, best_depth = move, depth
+        pending = len(self.jobs)
+        while pending:
+            try:
+                search_id, _, helper_move, helper_depth, _ = self.results.get(timeout=RESULT_TIMEOUT)
+            except queue.Empty:
+                break
+            if search_id != self._search_id:
+                continue  # Resposta atrasada de uma busca anterior
+            pending -= 1
+            if helper_move is not None and helper_depth > best_depth and board.is_legal(helper_move):
+                best_move, best_depth = helper_move, helper_depth
+        return best_move
+
+    def close(self):
+        self.stop_event.set()
+        for jobs in self.jobs:
+            jobs.put(None)
+        for process in self.processes:
+            process.join(timeout=RESULT_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+        self.jobs = []
+        self.processes = []
@@ -0,0 +1,115 @@
+import chess
+import chess.syzygy
+
+# Máximo de posições guardadas no cache de consultas WDL (esvaziado ao encher)
+WDL_CACHE_SIZE = 65536
+
+
+class EndgameTablebase:
+    """
+    Tablebases Syzygy (.rtbw/.rtbz) de uma pasta local, consultadas via
+    chess.syzygy. Sem pasta configurada (ou sem arquivos) nada é consultado.
+
+    Na raiz, best_move escolhe o lance perfeito pelo WDL/DTZ; dentro da busca,
+    probe_wdl dá o resultado exato (vitória/empate/derrota) das posições com
+    poucas peças, com cache por chave Zobrist.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.max_pieces = 0
+        self._tablebase = None
+        self._unavailable = False
+        self._wdl_cache = {}
+
+    def set_path(self, path):
+        """Troca a pasta das tablebases (None ou "" desliga)."""
+        self.close()
+        self.path = path
+        self._unavailable = False
+
+    def _open(self):
+        if self._tablebase is None and not self._unavailable:
+            if not self.path:
+                self._unavailable = True
+                return None
+            try:
+                tablebase = chess.syzygy.open_tablebase(self.path)
+            except (OSError, IOError) as e:
+                print(f"Aviso: tablebases Syzygy indisponíveis ({self.path}): {e}")
+                self._unavailable = True
+                return None
+            if not tablebase.wdl:
+                print(f"Aviso: nenhuma tablebase Syzygy encontrada em {self.path}")
+                tablebase.close()
+                self._unavailable = True
+                return None
+            self._tablebase = tablebase
+            # Nome da tabela = peças dos dois lados, ex.: "KRPvKR" (5 peças)
+            self.max_pieces = max(len(name) - 1 for name in tablebase.wdl)
+        return self._tablebase
+
+    def close(self):
+        if self._tablebase is not None:
+            self._tablebase.close()
+            self._tablebase = None
+        self.max_pieces = 0
+        self._wdl_cache = {}
+
+    def covers(self, board):
+        """True se a posição pode estar nas tablebases carregadas (poucas peças, sem roque)."""
+        if self._open() is None:
+            return False
+        return chess.popcount(board.occupied) <= self.max_pieces and not board.castling_rights
+
+    def probe_wdl(self, board, key=None):
+        """
+        Resultado para quem joga: 2 vitória, 0 empate, -2 derrota (1/-1: vitória
+        ou derrota anuladas pela regra dos 50 lances). None se não há tabela.
+        key: chave Zobrist da posição, usada no cache.
+        """
+        if not self.covers(board):
+            return None
+        if key is not None and key in self._wdl_cache:
+            return self._wdl_cache[key]
+        try:
+            wdl = self._tablebase.probe_wdl(board)
+        except KeyError:
+            wdl = None  # Tabela deste material não está na pasta
+        if key is not None:
+            if len(self._wdl_cache) >= WDL_CACHE_SIZE:
+                self._wdl_cache = {}
+            self._wdl_cache[key] = wdl
+        return wdl
+
+    def best_move(self, board):
+        """
+        Lance perfeito pela tablebase: preserva o melhor resultado (WDL) e,
+        entre eles, ganha o mais rápido / perde o mais devagar (DTZ).
+        None se a posição não está coberta.
+        """
+        if not self.covers(board):
+            return None
+        tablebase = self._tablebase
+        best_move, best_rank = None, None
+        for move in board.legal_moves:
+            zeroing = board.is_zeroing(move)
+            board.push(move)
+            try:
+                mate = board.is_checkmate()
+                # Valores do ponto de vista de quem joga a seguir: inverte o sinal
+                wdl = -tablebase.probe_wdl(board)
+                dtz = abs(tablebase.probe_dtz(board))
+            except KeyError:
+                return None
+            finally:
+                board.pop()
+            if wdl > 0:
+                rank = (wdl, mate, zeroing, -dtz)
+            elif wdl < 0:
+                rank = (wdl, not zeroing, dtz)
+            else:
+                rank = (wdl,)
+            if best_rank is None or rank > best_rank:
+                best_move, best_rank = move, rank
+        return best_move
@@ -0,0 +1,292 @@
+"""
+Torneio da IA contra ela mesma, sem pygame: joga partidas entre dois
+jogadores (dificuldades, controles de tempo ou versões de src/ai.py
+diferentes) em paralelo num pool de processos, grava os PGNs com o
+PGNManager e mostra placar, diferença de Elo com margem de erro (95%),
+nós/s médios e uso de tempo por partida.
+
+As partidas vêm em pares: mesma abertura (sorteada do livro), cores
+trocadas. Os motores jogam sem o próprio livro, se a versão tiver
+set_book_depth (as aberturas já variam o jogo). Para comparar com uma versão antiga da IA:
+    git show HEAD~3:src/ai.py > /tmp/ai_antigo.py
+    python -m src.tournament --ai src/ai.py /tmp/ai_antigo.py
+(o arquivo antigo usa os demais módulos de src/ da árvore atual).
+
+Uso: python -m src.tournament [--games N] [--workers N] [--difficulty A [B]]
+     [--tc BASE+INC [BASE+INC]] [--ai ARQ [ARQ]] [--opening-plies N]
+     [--pgn-dir PASTA] [--seed N]
+"""
+import argparse
+import importlib.util
+import inspect
+import math
+import multiprocessing
+import os
+import random
+import time
+from datetime import datetime
+
+import chess
+
+from src.config import get_user_data_dir
+from src.opening_book import OpeningBook
+from src.pgn_manager import PGNManager
+
+DEFAULT_AI_PATH = os.path.join("src", "ai.py")
+# Partidas longas demais são declaradas empate (meios-lances)
+MAX_GAME_PLIES = 400
+# Dificuldade usada para sortear as aberturas (expoente 0: lances do livro equiprováveis)
+OPENING_DIFFICULTY = 2
+
+# Por processo do pool: módulos de IA já carregados, por jogador
+_loaded_ais = {}
+
+
+class Player:
+    """Um lado do torneio: dificuldade, controle de tempo (None = sem relógio) e arquivo da IA."""
+
+    def __init__(self, difficulty, time_control=None, ai_path=DEFAULT_AI_PATH):
+        self.difficulty = difficulty
+        self.time_control = time_control
+        self.ai_path = ai_path
+
+    @property
+    def name(self):
+        tc = f" {self.time_control[0]:g}+{self.time_control[1]:g}" if self.time_control else ""
+        version = "" if self.ai_path == DEFAULT_AI_PATH else f" ({os.path.basename(self.ai_path)})"
+        return f"IA nível {self.difficulty}{tc}{version}"
+
+
+def parse_time_control(text):
+    """'60+0.5' -> (60.0, 0.5) em segundos; 'none' -> None (tempo por lance da dificuldade)."""
+    if text.lower() == "none":
+        return None
+    base, _, increment = text.partition("+")
+    return float(base), float(increment or 0)
+
+
+def _load_ai(slot, path):
+    """
+    Carrega o arquivo da IA como um módulo próprio para cada jogador: mesmo
+    com o mesmo arquivo, cada lado tem seu motor e sua tabela de transposição.
+    """
+    if slot not in _loaded_ais:
+        spec = importlib.util.spec_from_file_location(f"torneio_ai_{slot}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        if hasattr(module, "set_book_depth"):
+            module.set_book_depth(0)
+        _loaded_ais[slot] = module
+    return _loaded_ais[slot]
+
+
+def play_game(job):
+    """
+    Joga uma partida (roda nos processos do pool).
+    job: (índice, lances da abertura em UCI, [jogador brancas, jogador pretas], [slot brancas, slot pretas], semente)
+    Retorna um dicionário com o resultado, os lances e as estatísticas de cada cor.
+    """
+    index, opening, players, slots, seed = job
+    random.seed(seed)
+    ais = [_load_ai(slot, player.ai_path) for slot, player in zip(slots, players)]
+    for ai in ais:
+        if hasattr(ai, "new_game"):
+            ai.new_game()
+    accepts_clock = ["time_left" in inspect.signature(ai.get_best_move).parameters for ai in ais]
+
+    board = chess.Board()
+    for uci in opening:
+        board.push_uci(uci)
+    clocks = [player.time_control[0] if player.time_control else None for player in players]
+    sides = [{"nodes": 0, "search_time": 0.0, "moves": 0, "time_used": 0.0} for _ in players]
+    result, termination = None, "normal"
+    started = time.perf_counter()
+
+    while result is None:
+        if board.is_game_over(claim_draw=True):
+            result = board.result(claim_draw=True)
+            break
+        if len(board.move_stack) >= MAX_GAME_PLIES:
+            result, termination = "1/2-1/2", "limite de lances"
+            break
+        side = 0 if board.turn == chess.WHITE else 1
+        ai, player = ais[side], players[side]
+        move_start = time.perf_counter()
+        if accepts_clock[side]:
+            move = ai.get_best_move(board, player.difficulty, clocks[side])
+        else:
+            move = ai.get_best_move(board, player.difficulty)
+        elapsed = time.perf_counter() - move_start
+
+        stats = sides[side]
+        stats["moves"] += 1
+        stats["time_used"] += elapsed
+        last_stats = ai.get_last_stats() if hasattr(ai, "get_last_stats") else None
+        if last_stats is not None and last_stats.nodes:
+            stats["nodes"] += last_stats.nodes
+            stats["search_time"] += last_stats.elapsed
+        if clocks[side] is not None:
+            clocks[side] -= elapsed
+            if clocks[side] <= 0:
+                result = "0-1" if side == 0 else "1-0"
+                termination = "tempo"
+                break
+            clocks[side] += player.time_control[1]
+        if move is None or not board.is_legal(move):
+            result = "0-1" if side == 0 else "1-0"
+            termination = f"lance ilegal: {move}"
+            break
+        board.push(move)
+
+    return {
+        "index": index,
+        "slots": slots,
+        "moves": [move.uci() for move in board.move_stack],
+        "result": result,
+        "termination": termination,
+        "duration": time.perf_counter() - started,
+        "sides": sides,
+    }
+
+
+def generate_openings(count, plies, seed):
+    """`count` aberturas de até `plies` meios-lances sorteadas do livro (listas de lances UCI)."""
+    book = OpeningBook()
+    rng = random.Random(seed)
+    openings = []
+    for _ in range(count):
+        board = chess.Board()
+        for _ in range(plies):
+            move = book.choose_move(board, OPENING_DIFFICULTY, rng)
+            if move is None:
+                break
+            board.push(move)
+        openings.append([move.uci() for move in board.move_stack])
+    book.close()
+    return openings
+
+
+def elo_difference(wins, draws, losses):
+    """
+    (diferença de Elo, margem de erro de 95%) a partir do placar do jogador A.
+    Valores infinitos quando o placar é 100% ou 0%.
+    """
+    games = wins + draws + losses
+    if games == 0:
+        return 0.0, float("inf")
+    score = (wins + draws / 2) / games
+
+    def to_elo(p):
+        if p <= 0:
+            return -float("inf")
+        if p >= 1:
+            return float("inf")
+        return -400 * math.log10(1 / p - 1)
+
+    if score in (0, 1):
+        return to_elo(score), float("inf")
+    # Desvio padrão do resultado de uma partida (1, 0.5 ou 0)
+    variance = (wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score ** 2) / games
+    margin = 1.96 * math.sqrt(variance / games)
+    low, high = to_elo(score - margin), to_elo(score + margin)
+    return to_elo(score), (high - low) / 2
+
+
+def run(players, games, workers, opening_plies, pgn_dir, seed):
+    pairs = (games + 1) // 2
+    openings = generate_openings(pairs, opening_plies, seed)
+    jobs = []
+    for index in range(games):
+        opening = openings[index // 2]
+        # Jogos pares: A de brancas; ímpares: mesma abertura com as cores trocadas
+        order = [0, 1] if index % 2 == 0 else [1, 0]
+        jobs.append((index, opening, [players[i] for i in order], order, seed + index))
+
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    pgn_manager = PGNManager(pgn_dir)
+    event = f"Torneio PyChess {players[0].name} x {players[1].name}"
+    print(f"{event}: {games} partidas, {workers} processo(s)")
+    print(f"PGNs em {pgn_manager.data_dir}")
+
+    wins = draws = losses = 0
+    totals = [{"nodes": 0, "search_time": 0.0, "time_used": 0.0, "moves": 0} for _ in players]
+    total_duration = 0.0
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers) as pool:
+        for done, game in enumerate(pool.imap_unordered(play_game, jobs), 1):
+            slots, result = game["slots"], game["result"]
+            # Placar do ponto de vista do jogador A
+            if result == "1/2-1/2":
+                draws += 1
+            elif (result == "1-0") == (slots[0] == 0):
+                wins += 1
+            else:
+                losses += 1
+            for color, slot in enumerate(slots):
+                for name in totals[slot]:
+                    totals[slot][name] += game["sides"][color][name]
+            total_duration += game["duration"]
+
+            board = chess.Board()
+            for uci in game["moves"]:
+                board.push_uci(uci)
+            white, black = (players[slot] for slot in slots)
+            pgn_manager.save_game(
+                board, white.name, black.name, result, event=event, round_number=game["index"] + 1,
+                headers={"TimeControl": _pgn_time_control(white), "Termination": game["termination"]},
+                filename=f"torneio_{stamp}_{game['index'] + 1:03d}.pgn")
+            print(f"  {done:>3}/{games}  {white.name} x {black.name}: {result:<7} "
+                  f"{len(game['moves']):>3} meios-lances  {game['duration']:6.1f}s  "
+                  f"({game['termination']})   placar A {wins + draws / 2:g}/{done}")
+
+    elapsed = time.perf_counter() - start
+    elo, margin = elo_difference(wins, draws, losses)
+    print(f"\nResultado ({elapsed:.0f}s):")
+    print(f"  A = {players[0].name}")
+    print(f"  B = {players[1].name}")
+    print(f"  A: +{wins} ={draws} -{losses}  ({100 * (wins + draws / 2) / games:.1f}%)")
+    print(f"  Elo A - B: {elo:+.0f} ± {margin:.0f}")
+    for label, player, stats in zip("AB", players, totals):
+        # Versões sem get_last_stats não informam nós
+        nps = f"{stats['nodes'] / stats['search_time']:,.0f}" if stats["search_time"] else "?"
+        per_move = stats["time_used"] / stats["moves"] if stats["moves"] else 0
+        print(f"  {label}: {nps} nós/s  {stats['time_used'] / games:.1f}s por partida  "
+              f"{per_move:.2f}s por lance")
+    print(f"  duração média da partida: {total_duration / games:.1f}s")
+    return wins, draws, losses
+
+
+def _pgn_time_control(player):
+    if player.time_control is None:
+        return "-"
+    base, increment = player.time_control
+    return f"{base:g}+{increment:g}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Torneio da IA contra ela mesma")
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="processos (partidas simultâneas)")
+    parser.add_argument("--difficulty", type=int, nargs="+", default=[5],
+                        help="dificuldade de A e B (um valor vale para os dois)")
+    parser.add_argument("--tc", nargs="+", default=["none"],
+                        help="relógio BASE+INC em segundos de A e B, ou none (tempo por lance da dificuldade)")
+    parser.add_argument("--ai", nargs="+", default=[DEFAULT_AI_PATH],
+                        help="arquivo da IA de A e B (ex.: uma versão antiga de src/ai.py)")
+    parser.add_argument("--opening-plies", type=int, default=8,
+                        help="meios-lances de abertura sorteados do livro")
+    parser.add_argument("--pgn-dir", default=os.path.join(get_user_data_dir(), "pgn", "torneios"))
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    def pair(values):
+        return values[:2] if len(values) > 1 else values * 2
+
+    players = [Player(difficulty, parse_time_control(tc), path)
+               for difficulty, tc, path in zip(pair(args.difficulty), pair(args.tc), pair(args.ai))]
+    run(players, max(1, args.games), max(1, args.workers), args.opening_plies, args.pgn_dir, args.seed)
+
+
+if __name__ == "__main__":
+    main()
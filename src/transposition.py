@@ -0,0 +1,128 @@
+import ctypes
+import multiprocessing
+
+import chess
+
+# Tipos de limite guardados junto com o valor
+EXACT = 0   # Valor exato (ficou dentro da janela alpha-beta)
+LOWER = 1   # Houve corte beta: o valor real é >= score
+UPPER = 2   # Nenhum lance superou alpha: o valor real é <= score
+
+# Bytes por entrada: chave(8) + score(4) + lance(4) + profundidade(2) + flag(1) + idade(1)
+ENTRY_BYTES = 20
+DEFAULT_SIZE_MB = 16
+# Cada busca de idade desconta esta profundidade de uma entrada na disputa pelo slot
+AGE_DEPTH_PENALTY = 2
+
+
+def encode_move(move):
+    """Compacta um chess.Move em um inteiro (0 = sem lance)."""
+    if move is None:
+        return 0
+    return move.from_square | (move.to_square << 6) | ((move.promotion or 0) << 12)
+
+
+def decode_move(code):
+    if not code:
+        return None
+    promotion = code >> 12
+    return chess.Move(code & 63, (code >> 6) & 63, promotion=promotion or None)
+
+
+def slot_count(size_mb):
+    """Maior potência de 2 de entradas que cabe em size_mb."""
+    max_entries = max(1, int(size_mb * 1024 * 1024) // ENTRY_BYTES)
+    size = 1
+    while size * 2 <= max_entries:
+        size *= 2
+    return size
+
+
+def allocate_shared_buffer(size_mb):
+    """Bloco de memória compartilhável entre processos (Lazy SMP) para uma tabela."""
+    return multiprocessing.RawArray(ctypes.c_uint8, slot_count(size_mb) * ENTRY_BYTES)
+
+
+class TranspositionTable:
+    """
+    Tabela de transposição de tamanho fixo. As entradas ficam em colunas
+    tipadas sobre um único bloco de bytes (sem um objeto Python por entrada),
+    de forma que a memória não cresce ao longo da sessão e o mesmo bloco pode
+    ser compartilhado entre processos (ver allocate_shared_buffer).
+
+    Cada slot guarda chave de 64 bits, profundidade, score, tipo de limite
+    (EXACT/LOWER/UPPER), melhor lance e a geração (idade) da busca que o gravou.
+    Substituição: a entrada mais profunda é preservada, mas cada busca (geração)
+    de idade desconta AGE_DEPTH_PENALTY da sua profundidade. Assim a tabela não
+    é apagada entre lances, desfazer ou partidas novas: resultados recentes e
+    profundos continuam valendo, e os antigos saem aos poucos.
+    """
+
+    def __init__(self, size_mb=DEFAULT_SIZE_MB, buffer=None):
+        if buffer is None:
+            self.resize(size_mb)
+        else:
+            self._attach(buffer)
+            self.size_mb = size_mb
+            self.generation = 0
+
+    def _attach(self, buffer):
+        size = len(buffer) // ENTRY_BYTES
+        raw = memoryview(buffer).cast('B')
+        offset = 0
+        columns = []
+        for fmt, width in (('Q', 8), ('i', 4), ('I', 4), ('h', 2), ('B', 1), ('B', 1)):
+            columns.append(raw[offset:offset + width * size].cast(fmt))
+            offset += width * size
+        self.keys, self.scores, self.moves, self.depths, self.flags, self.ages = columns
+        self.buffer = buffer
+        self.size = size
+        self.mask = size - 1
+
+    def resize(self, size_mb):
+        """Realoca a tabela (descarta o conteúdo). O nº de slots é potência de 2."""
+        self._attach(bytearray(slot_count(size_mb) * ENTRY_BYTES))
+        self.size_mb = size_mb
+        self.generation = 0
+
+    def clear(self):
+        self.resize(self.size_mb)
+
+    def new_search(self, steps=1):
+        """Avança a geração (envelhece todas as entradas sem apagá-las)."""
+        self.generation = (self.generation + steps) & 0xFF
+
+    def hashfull(self, sample=1000):
+        """Ocupação da tabela em milésimos: slots da busca atual entre os `sample` primeiros."""
+        n = min(sample, self.size)
+        generation = self.generation
+        keys, ages = self.keys, self.ages
+        used = sum(1 for i in range(n) if keys[i] and ages[i] == generation)
+        return used * 1000 // n
+
+    def probe(self, key):
+        """
+        Retorna (profundidade, score, flag, lance) ou None se a posição não está na tabela.
+        """
+        i = key & self.mask
+        if self.keys[i] != key:
+            return None
+        return self.depths[i], self.scores[i], self.flags[i], decode_move(self.moves[i])
+
+    def store(self, key, depth, score, flag, move=None):
+        i = key & self.mask
+        same_position = self.keys[i] == key
+        # Preferência por profundidade, descontada pela idade da entrada
+        # (slots vazios têm chave 0 e profundidade 0: sempre substituíveis)
+        if not same_position:
+            age = (self.generation - self.ages[i]) & 0xFF
+            if depth < self.depths[i] - AGE_DEPTH_PENALTY * age:
+                return
+        # Re-gravação da mesma posição sem lance não apaga o lance anterior
+        if move is not None or not same_position:
+            self.moves[i] = encode_move(move)
+        self.keys[i] = key
+        self.depths[i] = depth
+        self.scores[i] = score
+        self.flags[i] = flag
+        self.ages[i] = self.generation
@@ -0,0 +1,273 @@
+"""
+Interface UCI do motor da IA, sem pygame: lê comandos na entrada padrão e
+responde na saída padrão. Permite jogar contra outros motores numa GUI ou
+em torneios (cutechess-cli, fastchess...) e medir/perfilar a busca sem SDL.
+
+Comandos: uci, isready, ucinewgame, setoption, position [startpos | fen FEN]
+[moves ...], go [depth N] [movetime MS] [wtime MS btime MS winc MS binc MS
+movestogo N] [infinite], stop, quit.
+Opções: Hash (MB), SyzygyPath, OwnBook.
+
+Uso: python -m src.uci
+"""
+import sys
+import threading
+import time
+
+import chess
+
+import src.ai as ai
+
+ENGINE_NAME = "PyChessDesktop"
+ENGINE_AUTHOR = "PyChessDesktop"
+# Profundidade máxima de "go infinite" / "go movetime" (a busca usa tabelas de MAX_PLY)
+MAX_DEPTH = 64
+# Margem por lance para a comunicação com a GUI (segundos)
+MOVE_OVERHEAD = 0.05
+DEFAULT_HASH_MB = 64
+MAX_HASH_MB = 1024
+
+
+def score_to_uci(score):
+    """Pontuação da busca (centipeões para quem joga) no formato UCI: "cp N" ou "mate N"."""
+    if abs(score) >= ai.MATE_BOUND:
+        plies = ai.MATE_SCORE - abs(score)
+        moves = (plies + 1) // 2
+        return f"mate {moves if score > 0 else -moves}"
+    return f"cp {score}"
+
+
+def parse_go(tokens):
+    """Parâmetros de "go" como dicionário: {"depth": 6, "wtime": 60000, "infinite": True...}."""
+    params = {}
+    i = 0
+    while i < len(tokens):
+        name = tokens[i]
+        if name in ("infinite", "ponder"):
+            params[name] = True
+            i += 1
+        elif name == "searchmoves":
+            # Não suportado: ignora a lista de lances
+            i += 1
+            while i < len(tokens) and not tokens[i].isalpha():
+                i += 1
+        else:
+            if i + 1 < len(tokens):
+                try:
+                    params[name] = int(tokens[i + 1])
+                except ValueError:
+                    pass
+            i += 2
+    return params
+
+
+def time_budget(board, params):
+    """
+    Orçamento (segundos) de um "go": movetime exato, ou uma fração do relógio
+    de quem joga (+ parte do incremento). None = sem limite de tempo.
+    """
+    if "movetime" in params:
+        return max(0.01, params["movetime"] / 1000 - MOVE_OVERHEAD)
+    clock, increment = ("wtime", "winc") if board.turn == chess.WHITE else ("btime", "binc")
+    if clock not in params:
+        return None
+    left = params[clock] / 1000
+    inc = params.get(increment, 0) / 1000
+    moves_to_go = params.get("movestogo") or ai.MOVES_TO_GO
+    budget = min(left / moves_to_go + inc * 3 / 4, left / 2)
+    return max(0.01, budget - MOVE_OVERHEAD)
+
+
+class UciSession:
+    """
+    Estado de uma sessão UCI: posição atual e a busca em andamento. A busca
+    roda numa thread para que "stop" e "isready" sejam atendidos durante ela.
+    """
+
+    def __init__(self, output=sys.stdout):
+        self.output = output
+        self.board = chess.Board()
+        self.own_book = False
+        self._lock = threading.Lock()
+        self._thread = None
+        self._infinite = False
+        self._stop = threading.Event()
+
+    def send(self, line):
+        with self._lock:
+            self.output.write(line + "\n")
+            self.output.flush()
+
+    def handle(self, line):
+        """Processa uma linha de comando. Retorna False em "quit"."""
+        tokens = line.split()
+        if not tokens:
+            return True
+        command, args = tokens[0], tokens[1:]
+        if command == "uci":
+            self.send(f"id name {ENGINE_NAME}")
+            self.send(f"id author {ENGINE_AUTHOR}")
+            self.send(f"option name Hash type spin default {DEFAULT_HASH_MB} min 1 max {MAX_HASH_MB}")
+            self.send("option name SyzygyPath type string default <empty>")
+            self.send("option name OwnBook type check default false")
+            self.send("uciok")
+        elif command == "isready":
+            self.send("readyok")
+        elif command == "setoption":
+            self.wait()
+            self.set_option(args)
+        elif command == "ucinewgame":
+            self.wait()
+            ai.new_game()
+        elif command == "position":
+            self.wait()
+            self.set_position(args)
+        elif command == "go":
+            self.wait()
+            self.go(parse_go(args))
+        elif command == "stop":
+            self.stop()
+        elif command == "quit":
+            self.stop()
+            return False
+        elif command not in ("debug", "register", "ponderhit"):
+            self.send(f"info string comando desconhecido: {command}")
+        return True
+
+    def set_option(self, args):
+        # setoption name <nome com espaços> [value <valor>]
+        if "name" not in args:
+            return
+        rest = args[args.index("name") + 1:]
+        if "value" in rest:
+            split = rest.index("value")
+            name, value = " ".join(rest[:split]), " ".join(rest[split + 1:])
+        else:
+            name, value = " ".join(rest), ""
+        name = name.lower()
+        if name == "hash":
+            try:
+                ai.set_transposition_table_size(max(1, min(MAX_HASH_MB, int(value))))
+            except ValueError:
+                self.send(f"info string valor inválido para Hash: {value}")
+        elif name == "syzygypath":
+            ai.set_tablebase_path("" if value == "<empty>" else value)
+        elif name == "ownbook":
+            self.own_book = value.lower() == "true"
+        else:
+            self.send(f"info string opção desconhecida: {name}")
+
+    def set_position(self, args):
+        board = chess.Board()
+        if args and args[0] == "fen":
+            end = args.index("moves") if "moves" in args else len(args)
+            try:
+                board = chess.Board(" ".join(args[1:end]))
+            except ValueError:
+                self.send(f"info string FEN inválida: {' '.join(args[1:end])}")
+                return
+            args = args[end:]
+        elif args and args[0] == "startpos":
+            args = args[1:]
+        if args and args[0] == "moves":
+            for uci in args[1:]:
+                try:
+                    move = board.parse_uci(uci)
+                except ValueError:
+                    self.send(f"info string lance ilegal: {uci}")
+                    break
+                board.push(move)
+        self.board = board
+
+    def go(self, params):
+        self._stop.clear()
+        self._infinite = bool(params.get("infinite"))
+        self._thread = threading.Thread(target=self._search, args=(self.board.copy(), params),
+                                        name="uci-busca", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Interrompe a busca em andamento e espera o "bestmove" ser enviado."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def wait(self):
+        """
+        Espera a busca em andamento terminar (comandos enviados antes do
+        "bestmove", ex.: por um script). "go infinite" só termina com stop.
+        """
+        if self._infinite:
+            self.stop()
+        elif self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _search(self, board, params):
+        try:
+            move, ponder = self._best_move(board, params)
+        except Exception as e:
+            self.send(f"info string erro na busca: {e}")
+            move, ponder = next(iter(board.legal_moves), None), None
+        # "go infinite": o bestmove só pode sair depois do "stop"
+        if params.get("infinite"):
+            self._stop.wait()
+        if move is None:
+            self.send("bestmove 0000")
+        elif ponder is not None:
+            self.send(f"bestmove {move.uci()} ponder {ponder.uci()}")
+        else:
+            self.send(f"bestmove {move.uci()}")
+
+    def _best_move(self, board, params):
+        """(lance, lance esperado do adversário ou None) para a posição."""
+        legal_moves = list(board.legal_moves)
+        if not legal_moves:
+            return None, None
+        if self.own_book:
+            book_move = ai.opening_book.choose_move(board, 5)
+            if book_move:
+                self.send("info string lance do livro")
+                return book_move, None
+        tablebase_move = ai.tablebase.best_move(board)
+        if tablebase_move:
+            self.send("info string lance da tablebase")
+            return tablebase_move, None
+
+        budget = time_budget(board, params)
+        infinite = budget is None
+        depth = params.get("depth", MAX_DEPTH)
+        config = ai.SearchConfig(max_depth=max(1, min(depth, MAX_DEPTH)),
+                                 max_time=budget if not infinite else float("inf"))
+        engine = ai.get_engine()
+        engine.table.new_search()
+        start = time.perf_counter()
+
+        def on_iteration(stats):
+            elapsed = time.perf_counter() - start
+            self.send(f"info depth {stats.depth} seldepth {stats.seldepth} "
+                      f"score {score_to_uci(stats.score)} nodes {stats.nodes} nps {stats.nps} "
+                      f"hashfull {engine.table.hashfull()} time {int(elapsed * 1000)} "
+                      f"pv {' '.join(move.uci() for move in stats.pv)}")
+
+        move, _, _ = engine.iterative_deepening(board, config, config.max_time,
+                                                stop_event=self._stop, on_iteration=on_iteration)
+        stats = engine.stats
+        self.send(f"info nodes {stats.nodes} nps {stats.nps} time {int(stats.elapsed * 1000)}")
+        ponder = stats.pv[1] if len(stats.pv) > 1 and stats.pv[0] == move else None
+        return move, ponder
+
+
+def main():
+    ai.set_transposition_table_size(DEFAULT_HASH_MB)
+    session = UciSession()
+    for line in sys.stdin:
+        if not session.handle(line):
+            break
+    # Fim da entrada (ex.: comandos enviados por um script): termina a busca atual
+    session.wait()
+
+
+if __name__ == "__main__":
+    main()
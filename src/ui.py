@@ -371,3 +371,51 @@ class Slider:
             text = f"{self.label}: {int(self.pct * 255)}"
         lbl = font.render(text, True, (220, 220, 220))
         screen.blit(lbl, (self.rect.x, self.rect.y - 25))
+
+
+class EngineDebugOverlay:
+    """
+    Painel de debug da IA sobre o tabuleiro (liga/desliga com F3): profundidade,
+    nós/s, ocupação da tabela de transposição, tempo de quadro e a variante
+    principal em setas. Só lê as estatísticas que a thread da busca atualiza.
+    """
+    # Cores das setas da variante principal: lances de quem pensa / respostas
+    PV_COLORS = ((255, 140, 0), (170, 90, 255))
+    PV_ARROWS = 4
+
+    def __init__(self, font, pos=(8, 8)):
+        self.font = font
+        self.pos = pos
+        self.visible = False
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def draw(self, screen, display_board, stats, hashfull, frame_ms, fps, thinking):
+        """
+        stats: SearchStats ao vivo (ou None); hashfull: ocupação da tabela em milésimos;
+        thinking: a IA está buscando a posição do tabuleiro (desenha as setas da PV).
+        """
+        if not self.visible:
+            return
+        if stats is not None and thinking:
+            for i, move in enumerate(stats.pv[:self.PV_ARROWS]):
+                display_board.draw_arrow(move, color=self.PV_COLORS[i % 2], width=max(3, 10 - 2 * i))
+
+        lines = [f"Quadro: {frame_ms:.1f} ms ({fps:.0f} fps)", f"TT: {hashfull / 10:.1f}% cheia"]
+        if stats is not None:
+            lines = [
+                f"IA: {'pensando' if thinking else 'parada'} ({stats.source})",
+                f"Profundidade: {stats.depth}/{stats.seldepth}",
+                f"Nós: {stats.nodes}  ({stats.nps} nós/s)",
+                f"Avaliação: {stats.score}",
+                f"PV: {' '.join(move.uci() for move in stats.pv[:6])}",
+            ] + lines
+
+        line_height = self.font.get_linesize()
+        width = max(self.font.size(line)[0] for line in lines) + 16
+        panel = pygame.Surface((width, line_height * len(lines) + 12), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for i, line in enumerate(lines):
+            panel.blit(self.font.render(line, True, (230, 230, 230)), (8, 6 + i * line_height))
+        screen.blit(panel, self.pos)
@@ -0,0 +1,93 @@
+import chess
+import chess.polyglot
+
+# Mesmos números aleatórios do formato Polyglot: as chaves calculadas aqui são
+# idênticas a chess.polyglot.zobrist_hash e servem também para o livro de aberturas.
+_RANDOM = chess.polyglot.POLYGLOT_RANDOM_ARRAY
+_CASTLING = 768
+_EP_FILE = 772
+_TURN = 780
+
+# Casas da torre no roque (padrão, não-Chess960): destino do rei -> (origem, destino)
+_CASTLING_ROOK = {
+    chess.G1: (chess.H1, chess.F1),
+    chess.C1: (chess.A1, chess.D1),
+    chess.G8: (chess.H8, chess.F8),
+    chess.C8: (chess.A8, chess.D8),
+}
+
+
+def board_key(board):
+    """Chave Zobrist completa da posição (usada na raiz; dentro da busca use push_move)."""
+    return chess.polyglot.zobrist_hash(board)
+
+
+def _piece(piece_type, color, square):
+    # Índice Polyglot: tipo*2 + 1 para as brancas
+    return _RANDOM[64 * ((piece_type - 1) * 2 + color) + square]
+
+
+def _state_key(board):
+    """Parte da chave que não depende das peças: roques, en passant e vez."""
+    h = 0
+    rights = board.castling_rights
+    if rights & chess.BB_H1:
+        h ^= _RANDOM[_CASTLING]
+    if rights & chess.BB_A1:
+        h ^= _RANDOM[_CASTLING + 1]
+    if rights & chess.BB_H8:
+        h ^= _RANDOM[_CASTLING + 2]
+    if rights & chess.BB_A8:
+        h ^= _RANDOM[_CASTLING + 3]
+    ep = board.ep_square
+    if ep:
+        # Polyglot só conta o en passant se houver um peão pronto para capturar
+        if board.turn == chess.WHITE:
+            mask = chess.shift_down(chess.BB_SQUARES[ep])
+        else:
+            mask = chess.shift_up(chess.BB_SQUARES[ep])
+        mask = chess.shift_left(mask) | chess.shift_right(mask)
+        if mask & board.pawns & board.occupied_co[board.turn]:
+            h ^= _RANDOM[_EP_FILE + chess.square_file(ep)]
+    if board.turn == chess.WHITE:
+        h ^= _RANDOM[_TURN]
+    return h
+
+
+def push_move(board, key, move):
+    """
+    Executa board.push(move) e devolve a nova chave, atualizada com alguns XORs
+    a partir de `key` (a chave antes do lance). Para desfazer basta board.pop()
+    e voltar a usar a chave anterior.
+    """
+    color = board.turn
+    from_sq = move.from_square
+    to_sq = move.to_square
+    piece_type = board.piece_type_at(from_sq)
+
+    h = key ^ _state_key(board)
+    h ^= _piece(piece_type, color, from_sq)
+
+    if piece_type == chess.KING and to_sq in _CASTLING_ROOK and abs(from_sq - to_sq) == 2:
+        rook_from, rook_to = _CASTLING_ROOK[to_sq]
+        h ^= _piece(chess.ROOK, color, rook_from) ^ _piece(chess.ROOK, color, rook_to)
+    elif piece_type == chess.PAWN and to_sq == board.ep_square and not board.piece_type_at(to_sq):
+        # En passant: o peão capturado está atrás da casa de destino
+        captured_sq = to_sq - 8 if color == chess.WHITE else to_sq + 8
+        h ^= _piece(chess.PAWN, not color, captured_sq)
+    else:
+        captured = board.piece_type_at(to_sq)
+        if captured:
+            h ^= _piece(captured, not color, to_sq)
+
+    h ^= _piece(move.promotion or piece_type, color, to_sq)
+
+    board.push(move)
+    return h ^ _state_key(board)
+
+
+def push_null(board, key):
+    """Executa o lance nulo (passa a vez) e devolve a nova chave."""
+    h = key ^ _state_key(board)
+    board.push(chess.Move.null())
+    return h ^ _state_key(board)